@@ -1,8 +1,3 @@
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "workoutapi"))
-
 # pylint: disable=missing-module-docstring
 
 from logging.config import fileConfig
@@ -22,12 +17,24 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# objetos da busca por nome criados com SQL puro (migração e9a3b5d17f42): a tabela FTS5 e as
+# tabelas-sombra dela no SQLite, o índice de trigramas no PostgreSQL. Não estão no
+# metadata, então o --autogenerate não pode propor removê-los
+SEARCH_OBJECTS = ("athlete_fts", "ix_athlete_name_trgm")
+
+
+def include_object(obj, name, type_, reflected, compare_to):  # pylint: disable=unused-argument
+    if reflected and compare_to is None and name and name.startswith(SEARCH_OBJECTS):
+        return False
+    return True
+
 
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -37,7 +44,9 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection):
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection, target_metadata=target_metadata, include_object=include_object
+    )
 
     with context.begin_transaction():
         context.run_migrations()
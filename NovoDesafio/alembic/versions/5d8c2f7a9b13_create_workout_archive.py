@@ -0,0 +1,53 @@
+"""create_workout_archive
+
+Revision ID: 5d8c2f7a9b13
+Revises: e9a3b5d17f42
+Create Date: 2026-10-18 13:32:47.118530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8c2f7a9b13'
+down_revision: Union[str, Sequence[str], None] = 'e9a3b5d17f42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('workout_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('athlete_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('sport_modality', sa.String(length=50), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['athlete_id'], ['athlete.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    postgresql_with={'fillfactor': 100}
+    )
+    op.create_index('ix_workout_archive_athlete_id_created_at', 'workout_archive', ['athlete_id', 'created_at'], unique=False)
+    op.create_index('ix_workout_archive_created_at', 'workout_archive', ['created_at'], unique=False)
+    op.create_table('workout_archive_rollup',
+    sa.Column('athlete_id', sa.Integer(), nullable=False),
+    sa.Column('sport_modality', sa.String(length=50), nullable=False),
+    sa.Column('workout_count', sa.Integer(), nullable=False),
+    sa.Column('first_workout_at', sa.DateTime(), nullable=False),
+    sa.Column('last_workout_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['athlete_id'], ['athlete.id'], ),
+    sa.PrimaryKeyConstraint('athlete_id', 'sport_modality')
+    )
+    # para mover os treinos antigos:
+    #   python -m workout_api.contrib.archive run
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('workout_archive_rollup')
+    op.drop_index('ix_workout_archive_created_at', table_name='workout_archive')
+    op.drop_index('ix_workout_archive_athlete_id_created_at', table_name='workout_archive')
+    op.drop_table('workout_archive')
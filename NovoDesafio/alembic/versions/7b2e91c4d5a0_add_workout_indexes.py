@@ -0,0 +1,30 @@
+"""add_workout_indexes
+
+Revision ID: 7b2e91c4d5a0
+Revises: 3ccf850bd837
+Create Date: 2026-10-18 11:40:12.318604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e91c4d5a0'
+down_revision: Union[str, Sequence[str], None] = '3ccf850bd837'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_workout_athlete_id_created_at', 'workout', ['athlete_id', 'created_at'], unique=False)
+    op.create_index('ix_workout_sport_modality_created_at', 'workout', ['sport_modality', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_workout_sport_modality_created_at', table_name='workout')
+    op.drop_index('ix_workout_athlete_id_created_at', table_name='workout')
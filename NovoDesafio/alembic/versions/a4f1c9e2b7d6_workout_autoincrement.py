@@ -0,0 +1,47 @@
+"""workout_autoincrement
+
+Revision ID: a4f1c9e2b7d6
+Revises: 5d8c2f7a9b13
+Create Date: 2026-10-18 16:05:12.402817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f1c9e2b7d6'
+down_revision: Union[str, Sequence[str], None] = '5d8c2f7a9b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # só o SQLite reaproveita ids (max(id) + 1); nos outros bancos a sequência já é
+    # monotônica. A tabela é recriada com AUTOINCREMENT e a sequência parte do maior
+    # id já usado, inclusive os que foram para o arquivo
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    with op.batch_alter_table('workout', recreate='always', table_kwargs={'sqlite_autoincrement': True}):
+        pass
+    op.execute(sa.text(
+        "INSERT INTO sqlite_sequence (name, seq) SELECT 'workout', 0 "
+        "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'workout')"
+    ))
+    op.execute(sa.text(
+        "UPDATE sqlite_sequence SET seq = max(seq, "
+        "(SELECT coalesce(max(id), 0) FROM workout), "
+        "(SELECT coalesce(max(id), 0) FROM workout_archive)) "
+        "WHERE name = 'workout'"
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    with op.batch_alter_table('workout', recreate='always', table_kwargs={'sqlite_autoincrement': False}):
+        pass
@@ -0,0 +1,38 @@
+"""create_workout_stats
+
+Revision ID: c41f6e0a8d27
+Revises: 7b2e91c4d5a0
+Create Date: 2026-10-18 12:05:31.904217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f6e0a8d27'
+down_revision: Union[str, Sequence[str], None] = '7b2e91c4d5a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('workout_stats',
+    sa.Column('athlete_id', sa.Integer(), nullable=False),
+    sa.Column('sport_modality', sa.String(length=50), nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('workout_count', sa.Integer(), nullable=False),
+    sa.Column('last_workout_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['athlete_id'], ['athlete.id'], ),
+    sa.PrimaryKeyConstraint('athlete_id', 'sport_modality', 'period_start')
+    )
+    # para popular a partir dos treinos existentes:
+    #   python -m workout_api.contrib.stats rebuild
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('workout_stats')
@@ -0,0 +1,59 @@
+"""add_athlete_name_search
+
+Revision ID: e9a3b5d17f42
+Revises: c41f6e0a8d27
+Create Date: 2026-10-18 12:48:09.551372
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a3b5d17f42'
+down_revision: Union[str, Sequence[str], None] = 'c41f6e0a8d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX ix_athlete_name_trgm ON athlete USING gin (name gin_trgm_ops)")
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE athlete_fts USING fts5("
+        "name, content='athlete', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    )
+    op.execute(
+        "CREATE TRIGGER athlete_fts_ai AFTER INSERT ON athlete BEGIN "
+        "INSERT INTO athlete_fts(rowid, name) VALUES (new.id, new.name); END"
+    )
+    op.execute(
+        "CREATE TRIGGER athlete_fts_ad AFTER DELETE ON athlete BEGIN "
+        "INSERT INTO athlete_fts(athlete_fts, rowid, name) VALUES ('delete', old.id, old.name); END"
+    )
+    op.execute(
+        "CREATE TRIGGER athlete_fts_au AFTER UPDATE OF name ON athlete BEGIN "
+        "INSERT INTO athlete_fts(athlete_fts, rowid, name) VALUES ('delete', old.id, old.name); "
+        "INSERT INTO athlete_fts(rowid, name) VALUES (new.id, new.name); END"
+    )
+    # indexa os atletas que já existem
+    op.execute("INSERT INTO athlete_fts(athlete_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_athlete_name_trgm")
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS athlete_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS athlete_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS athlete_fts_ai")
+    op.execute("DROP TABLE IF EXISTS athlete_fts")
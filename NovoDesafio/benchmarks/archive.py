@@ -0,0 +1,169 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, import-outside-toplevel
+#
+# Latência das leituras "quentes" (últimos meses) conforme o histórico cresce, com
+# os treinos antigos arquivados (workout_archive) e com tudo numa tabela só.
+# Cada tamanho de histórico usa um SQLite novo; o cache fica desligado para toda
+# requisição chegar ao banco.
+#
+#   python -m benchmarks.archive --history 0 100000 500000 --max-growth 0.5
+
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.load import MODALITIES, SEED_CHUNK
+
+MODES = ("archive", "single")
+RECENT_DAYS = 60
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Hot-path latency vs. total workout history")
+    parser.add_argument("--athletes", type=int, default=1_000)
+    parser.add_argument("--recent", type=int, default=50_000, help=f"workouts in the last {RECENT_DAYS} days")
+    parser.add_argument("--history", type=int, nargs="+", default=[0, 100_000, 500_000],
+                        help="old workouts (older than ARCHIVE_AFTER_DAYS) per run")
+    parser.add_argument("--after-days", type=int, default=180)
+    parser.add_argument("--requests", type=int, default=300, help="requests per route")
+    parser.add_argument("--max-growth", type=float, default=0.5,
+                        help="max p95 growth of archive mode from the smallest to the largest history")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+def _timestamp(value: datetime) -> str:
+    # mesmo formato que o SQLAlchemy grava, para os cursores compararem certo
+    return value.isoformat(sep=" ", timespec="microseconds")
+
+
+def seed_history(path: str, args, history: int, now: datetime, rng: random.Random):
+    # os antigos primeiro (ids menores), como numa base que cresceu com o tempo
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO athlete (id, name, cpf, age) VALUES (?, ?, ?, ?)",
+            ((i, f"Athlete {i}", f"{i:011d}", rng.randint(16, 60)) for i in range(1, args.athletes + 1)),
+        )
+
+    old_end = now - timedelta(days=args.after_days + 7)
+    old_span = int(timedelta(days=365 * 5).total_seconds())
+    recent_span = int(timedelta(days=RECENT_DAYS).total_seconds())
+    batches = [(history, old_end, old_span), (args.recent, now, recent_span)]
+    for total, end, span in batches:
+        for offset in range(0, total, SEED_CHUNK):
+            count = min(SEED_CHUNK, total - offset)
+            moments = sorted(end - timedelta(seconds=rng.randrange(span)) for _ in range(count))
+            rows = [
+                (rng.randint(1, args.athletes), f"Workout {offset + i}", rng.choice(MODALITIES), _timestamp(moment))
+                for i, moment in enumerate(moments)
+            ]
+            with conn:
+                conn.executemany(
+                    "INSERT INTO workout (athlete_id, name, sport_modality, created_at) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+    conn.close()
+
+
+def hot_requests(args, history: int, now: datetime, rng: random.Random):
+    first_recent = history + 1
+    created_from = (now - timedelta(days=7)).isoformat()
+    return {
+        "athlete workouts": lambda: (f"/athletes/{rng.randint(1, args.athletes)}/workouts", {"limit": 10}),
+        "workout by id": lambda: (f"/workouts/{rng.randint(first_recent, history + args.recent - 1)}", {}),
+        "recent workouts": lambda: (
+            "/workouts/", {"order_by": "created_at", "created_from": created_from, "limit": 50}
+        ),
+    }
+
+
+async def run(args, mode: str, history: int) -> dict:
+    import httpx
+    from workout_api.configs.database import Base, Settings, database
+    from workout_api.contrib.archive import archive_cutoff, archive_workouts
+    from workout_api.main import create_app
+    import workout_api.models  # noqa: F401  pylint: disable=unused-import
+
+    path = os.path.join(tempfile.mkdtemp(prefix="workout-archive-"), "archive.db")
+    settings = Settings(
+        database_url=f"sqlite+aiosqlite:///{path}", cache_backend="none", admission_enabled=False
+    )
+    database.configure(settings)
+    async with database.connect().engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    now = datetime.utcnow()
+    rng = random.Random(args.seed)
+    seed_history(path, args, history, now, rng)
+
+    archived = 0
+    archive_seconds = 0.0
+    if mode == "archive":
+        start = time.perf_counter()
+        archived = await archive_workouts(
+            archive_cutoff(now, args.after_days), settings.archive_batch_size, pause_ms=0
+        )
+        archive_seconds = time.perf_counter() - start
+    await database.dispose()
+
+    results = {"archived": archived, "archive_seconds": archive_seconds, "routes": {}}
+    app = create_app(settings)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://archive") as client:
+            for name, build in hot_requests(args, history, now, rng).items():
+                latencies = []
+                for _ in range(args.requests):
+                    path_, params = build()
+                    start = time.perf_counter()
+                    response = await client.get(path_, params=params)
+                    latencies.append(time.perf_counter() - start)
+                    response.raise_for_status()
+                latencies.sort()
+                results["routes"][name] = {
+                    "p50_ms": statistics.median(latencies) * 1000,
+                    "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+                }
+    return results
+
+
+def main(args) -> int:
+    histories = sorted(args.history)
+    results = {}
+    for history in histories:
+        for mode in MODES:
+            result = asyncio.run(run(args, mode, history))
+            results[mode, history] = result
+            extra = ""
+            if mode == "archive":
+                rate = result["archived"] / result["archive_seconds"] if result["archive_seconds"] else 0
+                extra = f"  (archived {result['archived']} rows, {rate:,.0f} rows/s)"
+            print(f"history={history:>9} {mode:<8}{extra}")
+            for name, route in result["routes"].items():
+                print(f"    {name:<18} p50 {route['p50_ms']:7.2f} ms   p95 {route['p95_ms']:7.2f} ms")
+
+    failures = 0
+    smallest, largest = histories[0], histories[-1]
+    for name in results["archive", smallest]["routes"]:
+        base = results["archive", smallest]["routes"][name]["p95_ms"]
+        grown = results["archive", largest]["routes"][name]["p95_ms"]
+        single = results["single", largest]["routes"][name]["p95_ms"]
+        growth = grown / base - 1
+        ok = growth <= args.max_growth
+        failures += not ok
+        print(
+            f"{'ok  ' if ok else 'FAIL'} {name}: p95 {base:.2f} -> {grown:.2f} ms ({growth:+.0%}) "
+            f"with archive, {single:.2f} ms single-table at history={largest}"
+        )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
@@ -0,0 +1,212 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, import-outside-toplevel
+#
+# Benchmark in-process da API (httpx + ASGITransport) contra um SQLite temporário.
+#
+#   python -m benchmarks.load --athletes 10000 --workouts 1000000 --write-baseline benchmarks/baseline.json
+#   python -m benchmarks.load --baseline benchmarks/baseline.json --tolerance 0.15
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+WORKLOADS = ("list", "get", "create", "patch", "mixed")
+MODALITIES = ("running", "cycling", "swimming", "crossfit", "yoga")
+SEED_CHUNK = 50_000
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Workout API load test")
+    parser.add_argument("--athletes", type=int, default=10_000)
+    parser.add_argument("--workouts", type=int, default=1_000_000)
+    parser.add_argument("--requests", type=int, default=2_000, help="requests per workload")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--read-ratio", type=float, default=0.9, help="share of reads in 'mixed'")
+    parser.add_argument("--workloads", nargs="+", choices=WORKLOADS, default=list(WORKLOADS))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write this run's results to a JSON file")
+    parser.add_argument("--write-baseline", help="write results as the new baseline")
+    parser.add_argument("--baseline", help="compare against a baseline JSON and fail on regression")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    return parser.parse_args(argv)
+
+
+def seed_database(path: str, athletes: int, workouts: int, rng: random.Random):
+    # carga direta via sqlite3: é ordens de grandeza mais rápida que passar pela API
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO athlete (id, name, cpf, age) VALUES (?, ?, ?, ?)",
+            ((i, f"Athlete {i}", f"{i:011d}", rng.randint(16, 60)) for i in range(1, athletes + 1)),
+        )
+
+    start = datetime(2020, 1, 1)
+    span = int((datetime(2026, 1, 1) - start).total_seconds())
+    for offset in range(0, workouts, SEED_CHUNK):
+        rows = [
+            (
+                rng.randint(1, athletes),
+                f"Workout {i}",
+                rng.choice(MODALITIES),
+                # mesmo formato que o SQLAlchemy grava, senão os cursores (created_at, id) comparam errado
+                (start + timedelta(seconds=rng.randrange(span))).isoformat(sep=" ", timespec="microseconds"),
+            )
+            for i in range(offset, min(offset + SEED_CHUNK, workouts))
+        ]
+        with conn:
+            conn.executemany(
+                "INSERT INTO workout (athlete_id, name, sport_modality, created_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+    conn.close()
+
+
+def build_request(workload: str, args, rng: random.Random):
+    if workload == "mixed":
+        workload = rng.choice(("list", "get")) if rng.random() < args.read_ratio else rng.choice(("create", "patch"))
+
+    workout_id = rng.randint(1, args.workouts)
+    if workload == "list":
+        return "GET", "/workouts/", {"params": {"limit": 50}}
+    if workload == "get":
+        return "GET", f"/workouts/{workout_id}", {}
+    if workload == "create":
+        body = {"athlete_id": rng.randint(1, args.athletes), "name": "Bench", "sport_modality": rng.choice(MODALITIES)}
+        return "POST", "/workouts/", {"json": body}
+    return "PATCH", f"/workouts/{workout_id}", {"json": {"name": f"Bench {rng.randrange(1000)}"}}
+
+
+async def run_workload(client, workload: str, args, rng: random.Random) -> dict:
+    requests = [build_request(workload, args, rng) for _ in range(args.requests)]
+    latencies = []
+    errors = 0
+    server_errors = 0
+    shed = 0
+    queue = iter(requests)
+
+    async def worker():
+        nonlocal errors, server_errors, shed
+        for method, url, kwargs in queue:
+            start = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+            # 503 é o controle de admissão recusando carga, não uma falha da aplicação
+            if response.status_code == 503:
+                shed += 1
+                # cliente bem-comportado: espera o Retry-After antes de mandar a próxima
+                await asyncio.sleep(float(response.headers.get("retry-after", 0)))
+            elif response.status_code >= 500:
+                server_errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "server_errors": server_errors,
+        "shed": shed,
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for workload, current in results["workloads"].items():
+        previous = baseline["workloads"].get(workload)
+        if previous is None:
+            continue
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{workload}: throughput {current['throughput_rps']} < baseline {previous['throughput_rps']}"
+            )
+        for key in ("p95_ms", "p99_ms"):
+            if current[key] > previous[key] * (1 + tolerance):
+                regressions.append(f"{workload}: {key} {current[key]} > baseline {previous[key]}")
+    return regressions
+
+
+async def main(args) -> int:
+    rng = random.Random(args.seed)
+    workdir = tempfile.mkdtemp(prefix="workout-bench-")
+    db_path = os.path.join(workdir, "bench.db")
+
+    # precisa estar definido antes de importar a aplicação
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{db_path}"
+
+    import httpx
+    from workout_api.configs.database import Base, database
+    from workout_api.main import create_app
+    import workout_api.models  # noqa: F401  pylint: disable=unused-import
+
+    app = create_app()
+    async with database.connect().engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    start = time.perf_counter()
+    seed_database(db_path, args.athletes, args.workouts, rng)
+    print(f"seeded {args.athletes} athletes / {args.workouts} workouts in {time.perf_counter() - start:.1f}s")
+
+    results = {
+        "config": {
+            "athletes": args.athletes,
+            "workouts": args.workouts,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "read_ratio": args.read_ratio,
+        },
+        "workloads": {},
+    }
+
+    # exceções da aplicação (ex.: "database is locked") viram 500 e são contadas;
+    # o ASGITransport não dispara o lifespan, então ele roda aqui (warmup e dispose)
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for workload in args.workloads:
+                stats = await run_workload(client, workload, args, rng)
+                results["workloads"][workload] = stats
+                print(
+                    f"{workload:>7}: {stats['throughput_rps']:>9} req/s  "
+                    f"p50 {stats['p50_ms']}ms  p95 {stats['p95_ms']}ms  p99 {stats['p99_ms']}ms  "
+                    f"errors {stats['errors']} (5xx {stats['server_errors']}, shed {stats['shed']})"
+                )
+
+    for path in filter(None, (args.output, args.write_baseline)):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    failed = any(stats["server_errors"] for stats in results["workloads"].values())
+    if failed:
+        print("FAIL: server errors under load")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if baseline["config"] != results["config"]:
+            print("warning: baseline was recorded with a different configuration")
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
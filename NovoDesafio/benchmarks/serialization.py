@@ -0,0 +1,101 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, import-outside-toplevel
+#
+# Microbenchmark da serialização de listas: caminho antigo (entidades ORM +
+# validação do response_model) contra o caminho rápido (tuplas + to_json).
+# Também confere que os dois caminhos produzem exatamente os mesmos bytes.
+#
+#   python -m benchmarks.serialization --rows 10000
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="List serialization microbenchmark")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    return parser.parse_args(argv)
+
+
+def build_app():
+    from fastapi import Depends, FastAPI
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from workout_api.configs.database import get_session
+    from workout_api.contrib.pagination import (
+        CursorPage, encode_cursor, keyset, page_response, paginate, select_fields,
+    )
+    from workout_api.models.workout import WorkoutModel
+    from workout_api.schemas.workout import WorkoutOut
+
+    app = FastAPI()
+    columns = [WorkoutModel.id]
+
+    @app.get("/legacy", response_model=CursorPage[WorkoutOut])
+    async def legacy(limit: int, db: AsyncSession = Depends(get_session)):
+        result = await db.execute(keyset(select(WorkoutModel), columns, None).limit(limit + 1))
+        items = result.scalars().all()
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor([items[-1].id])
+        return {"items": items, "next_cursor": next_cursor}
+
+    @app.get("/fast", response_model=CursorPage[WorkoutOut])
+    async def fast(limit: int, db: AsyncSession = Depends(get_session)):
+        page = await paginate(db, select_fields(WorkoutModel, WorkoutOut), columns, None, limit)
+        return page_response(page)
+
+    return app
+
+
+async def timed(client, path: str, limit: int, repeat: int):
+    body = (await client.get(path, params={"limit": limit})).content  # aquecimento
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await client.get(path, params={"limit": limit})
+    return body, (time.perf_counter() - start) / repeat
+
+
+async def main(args) -> int:
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/serialization.db"
+
+    import httpx
+    from sqlalchemy import insert
+    from workout_api.configs.database import Base, database
+    import workout_api.models  # noqa: F401  pylint: disable=unused-import
+    from workout_api.models.athlete import AthleteModel
+    from workout_api.models.workout import WorkoutModel
+
+    async with database.connect().engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(AthleteModel), [{"name": "Bench", "cpf": "00000000000", "age": 30}])
+        await conn.execute(insert(WorkoutModel), [
+            {"athlete_id": 1, "name": f"Treino {i} ção", "sport_modality": "running"}
+            for i in range(args.rows + 1)
+        ])
+
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        legacy_body, legacy_time = await timed(client, "/legacy", args.rows, args.repeat)
+        fast_body, fast_time = await timed(client, "/fast", args.rows, args.repeat)
+
+    await database.dispose()
+
+    print(f"legacy: {legacy_time * 1000:.1f} ms / {args.rows} rows")
+    print(f"fast:   {fast_time * 1000:.1f} ms / {args.rows} rows  ({legacy_time / fast_time:.1f}x)")
+
+    if legacy_body != fast_body:
+        print("FAIL: responses differ")
+        return 1
+    print(f"identical output ({len(fast_body)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
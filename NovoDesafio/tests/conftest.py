@@ -0,0 +1,54 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, redefined-outer-name
+#
+# Cada teste roda contra um SQLite temporário próprio, com a aplicação inteira
+# (lifespan incluso) e sem cache, para toda leitura chegar ao banco.
+
+import random
+
+import httpx
+import pytest
+
+from benchmarks.load import seed_database
+from workout_api.configs.database import Base, Settings, database
+from workout_api.main import create_app
+import workout_api.models  # noqa: F401  pylint: disable=unused-import
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "test.db")
+
+
+@pytest.fixture
+def settings(db_path):
+    return Settings(database_url=f"sqlite+aiosqlite:///{db_path}", cache_backend="none")
+
+
+@pytest.fixture
+async def app(settings):
+    database.configure(settings)
+    async with database.connect().engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    app = create_app(settings)
+    async with app.router.lifespan_context(app):
+        yield app
+
+
+@pytest.fixture
+async def client(app):
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def seeded(app, db_path):
+    # 200 atletas / 4000 treinos gravados direto via sqlite3
+    seed_database(db_path, 200, 4_000, random.Random(42))
+    return app
@@ -0,0 +1,53 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, unused-argument
+#
+# Os limites de admissão acompanham os pools, e ninguém espera por uma conexão mais
+# do que esperaria na fila de admissão.
+
+import pytest
+
+from workout_api.configs.database import Settings, database
+from workout_api.contrib.admission import admission_limits
+
+pytestmark = pytest.mark.anyio
+
+SQLITE = Settings(database_url="sqlite+aiosqlite:///workout.db")
+
+
+def test_limits_follow_the_pools():
+    assert admission_limits(SQLITE) == (SQLITE.db_read_pool_size, 1)
+    assert admission_limits(SQLITE.model_copy(update={"db_read_pool_size": 8})) == (8, 1)
+
+
+def test_group_commit_admits_a_whole_batch():
+    batching = SQLITE.model_copy(update={"workout_batch_enabled": True, "workout_batch_size": 50})
+    assert admission_limits(batching) == (SQLITE.db_read_pool_size, 50)
+
+
+def test_explicit_limits_win():
+    explicit = SQLITE.model_copy(update={"admission_read_limit": 64, "admission_write_limit": 32})
+    assert admission_limits(explicit) == (64, 32)
+
+
+def test_server_databases_share_one_pool():
+    server = Settings(database_url="postgresql+asyncpg://localhost/workout")
+    assert admission_limits(server) == (15, 15)
+
+
+@pytest.fixture
+def settings(db_path):
+    return Settings(
+        database_url=f"sqlite+aiosqlite:///{db_path}", cache_backend="none",
+        admission_write_limit=4, admission_queue_timeout_ms=100,
+    )
+
+
+async def test_pool_wait_is_capped_by_the_admission_deadline(seeded, client):
+    assert database.engine.pool.timeout() == pytest.approx(0.1)
+    assert database.read_engine.pool.timeout() == pytest.approx(0.1)
+
+    # com a única conexão de escrita ocupada, o PATCH admitido não fica 30 s no pool
+    async with database.engine.connect():
+        response = await client.patch("/workouts/1", json={"name": "Busy"})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
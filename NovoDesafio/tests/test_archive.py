@@ -0,0 +1,76 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, unused-argument
+#
+# Arquivar não pode liberar ids (um treino novo nunca recebe o id de um arquivado), e
+# os filtros por data com fuso continuam funcionando com parte do histórico arquivada.
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from workout_api.contrib.archive import archive_workouts
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_archiving_the_newest_workouts_does_not_reuse_ids(seeded, client, db_path):
+    moved = await archive_workouts(datetime(9999, 1, 1), batch_size=1_000)
+    assert moved == 4_000
+
+    response = await client.post("/workouts/", json={"athlete_id": 1, "name": "New", "sport_modality": "running"})
+    assert response.status_code == 201
+    assert response.json()["id"] == 4_001
+
+    response = await client.get("/workouts/4000")
+    assert response.status_code == 200
+    assert response.json()["name"] != "New"
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT count(*) FROM workout_archive WHERE id = 4001").fetchone() == (0,)
+
+
+async def _collect(client, path, params):
+    items, cursor = [], None
+    while True:
+        response = await client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        body = response.json()
+        items += [item["id"] for item in body["items"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return items
+
+
+ROUTES = {
+    "workouts": ("/workouts/", {"order_by": "created_at", "limit": 100}),
+    "athlete workouts": ("/athletes/3/workouts", {"limit": 20}),
+}
+
+
+@pytest.mark.parametrize("route", ROUTES)
+async def test_created_from_accepts_timezones(seeded, client, db_path, route):
+    with sqlite3.connect(db_path) as conn:
+        (middle,) = conn.execute(
+            "SELECT created_at FROM workout ORDER BY created_at LIMIT 1 OFFSET 2000"
+        ).fetchone()
+    middle = datetime.fromisoformat(middle)
+    await archive_workouts(middle, batch_size=1_000)
+
+    path, params = ROUTES[route]
+    since = middle - timedelta(days=30)
+    naive = await _collect(client, path, {**params, "created_from": since.isoformat()})
+    assert naive
+
+    utc = await _collect(client, path, {**params, "created_from": since.isoformat() + "Z"})
+    shifted = since - timedelta(hours=3)
+    local = await _collect(client, path, {**params, "created_from": shifted.isoformat() + "-03:00"})
+    assert utc == naive
+    assert local == naive
+
+
+async def test_export_accepts_timezones(seeded, client):
+    await archive_workouts(datetime(2100, 1, 1), batch_size=1_000)
+
+    response = await client.get("/workouts/export", params={"created_from": "2019-01-01T00:00:00Z"})
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 4_000
@@ -0,0 +1,27 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, unused-argument
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_delete_athlete_with_workouts_is_rejected(client):
+    athlete = (await client.post("/athletes/", json={"name": "Ana", "cpf": "1", "age": 30})).json()
+    workout = {"athlete_id": athlete["id"], "name": "Run", "sport_modality": "running"}
+    assert (await client.post("/workouts/", json=workout)).status_code == 201
+
+    response = await client.delete(f"/athletes/{athlete['id']}")
+    assert response.status_code == 409
+    assert (await client.get(f"/athletes/{athlete['id']}")).status_code == 200
+
+    response = await client.get("/workouts/", params={"include": "athlete"})
+    assert response.status_code == 200
+    assert response.json()["items"][0]["athlete"]["id"] == athlete["id"]
+
+
+async def test_delete_athlete(client):
+    athlete = (await client.post("/athletes/", json={"name": "Bia", "cpf": "2", "age": 30})).json()
+
+    assert (await client.delete(f"/athletes/{athlete['id']}")).status_code == 204
+    assert (await client.get(f"/athletes/{athlete['id']}")).status_code == 404
+    assert (await client.delete(f"/athletes/{athlete['id']}")).status_code == 404
@@ -0,0 +1,68 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, redefined-outer-name, unused-argument
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+
+from workout_api.configs.database import Settings, database
+from workout_api.contrib.cache import LocalCache, athlete_key, cache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def settings(db_path):
+    return Settings(database_url=f"sqlite+aiosqlite:///{db_path}", cache_backend="local")
+
+
+async def test_fill_after_invalidate_is_dropped():
+    cache = LocalCache(max_entries=10, ttl=60)
+    version = await cache.version("athlete:1")
+    await cache.invalidate("athlete:1")
+
+    await cache.set_if_version("athlete:1", b"old", version, time.monotonic())
+    assert await cache.get("athlete:1") is None
+
+    version = await cache.version("athlete:1")
+    await cache.set_if_version("athlete:1", b"new", version, time.monotonic())
+    assert await cache.get("athlete:1") == b"new"
+
+
+async def test_slow_fill_is_dropped():
+    cache = LocalCache(max_entries=10, ttl=60)
+    await cache.set_if_version("athlete:1", b"old", 0, time.monotonic() - 61)
+    assert await cache.get("athlete:1") is None
+
+
+async def test_read_racing_a_write_does_not_cache_the_old_row(client, monkeypatch):
+    athlete = (await client.post("/athletes/", json={"name": "Ana", "cpf": "1", "age": 30})).json()
+    await cache.delete(athlete_key(athlete["id"]))
+
+    # o GET abre duas sessões de leitura: a da dependência e a da consulta que
+    # preenche o cache. A segunda para depois do SELECT, antes de gravar no cache
+    selected, release = asyncio.Event(), asyncio.Event()
+    read_session = database.read_session
+    calls = []
+
+    @asynccontextmanager
+    async def paused_read_session():
+        calls.append(None)
+        async with read_session() as db:
+            yield db
+        if len(calls) == 2:
+            selected.set()
+            await release.wait()
+
+    monkeypatch.setattr(database, "read_session", paused_read_session)
+    reading = asyncio.create_task(client.get(f"/athletes/{athlete['id']}"))
+    await selected.wait()
+
+    response = await client.patch(f"/athletes/{athlete['id']}", json={"age": 40})
+    assert response.status_code == 200
+    release.set()
+    assert (await reading).json()["age"] == 30
+
+    response = await client.get(f"/athletes/{athlete['id']}")
+    assert response.json()["age"] == 40
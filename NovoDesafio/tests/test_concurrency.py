@@ -0,0 +1,41 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, unused-argument
+#
+# Perfil SQLite (WAL + uma conexão de escrita): escritas e leituras concorrentes
+# não podem virar 500 ("database is locked").
+
+import asyncio
+import random
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+MODALITIES = ("running", "cycling", "swimming")
+
+
+async def test_concurrent_writes_have_no_server_errors(seeded, client):
+    rng = random.Random(7)
+    requests = []
+    for _ in range(300):
+        roll = rng.random()
+        if roll < 0.4:
+            body = {"athlete_id": rng.randint(1, 200), "name": "Test", "sport_modality": rng.choice(MODALITIES)}
+            requests.append(("POST", "/workouts/", {"json": body}))
+        elif roll < 0.8:
+            body = {"name": f"Test {rng.randrange(1000)}", "sport_modality": rng.choice(MODALITIES)}
+            requests.append(("PATCH", f"/workouts/{rng.randint(1, 4_000)}", {"json": body}))
+        else:
+            requests.append(("GET", f"/athletes/{rng.randint(1, 200)}/workouts", {}))
+
+    queue = iter(requests)
+    statuses = []
+
+    async def worker():
+        for method, url, kwargs in queue:
+            response = await client.request(method, url, **kwargs)
+            statuses.append(response.status_code)
+
+    await asyncio.gather(*(worker() for _ in range(32)))
+
+    assert len(statuses) == len(requests)
+    assert not [code for code in statuses if code >= 500]
@@ -0,0 +1,53 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+
+import os
+import sqlite3
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from alembic.util.exc import AutogenerateDiffsDetected
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def alembic_config(db_path):
+    config = Config(os.path.join(ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(ROOT, "alembic"))
+    config.set_main_option("sqlalchemy.url", f"sqlite+aiosqlite:///{db_path}")
+    return config
+
+
+def test_migrations_match_models(alembic_config):
+    command.upgrade(alembic_config, "head")
+    try:
+        command.check(alembic_config)
+    except AutogenerateDiffsDetected as exc:
+        pytest.fail(str(exc))
+
+    command.downgrade(alembic_config, "base")
+    command.upgrade(alembic_config, "head")
+
+
+def test_workout_ids_continue_after_the_archive(alembic_config, db_path):
+    command.upgrade(alembic_config, "5d8c2f7a9b13")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("INSERT INTO athlete (id, name, cpf, age) VALUES (1, 'Ana', '00000000001', 30)")
+        conn.execute(
+            "INSERT INTO workout (id, athlete_id, name, sport_modality, created_at) "
+            "VALUES (3, 1, 'Hot', 'running', '2026-01-01 00:00:00.000000')"
+        )
+        conn.execute(
+            "INSERT INTO workout_archive (id, athlete_id, name, sport_modality, created_at) "
+            "VALUES (7, 1, 'Old', 'running', '2020-01-01 00:00:00.000000')"
+        )
+
+    command.upgrade(alembic_config, "head")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM workout")
+        cursor = conn.execute(
+            "INSERT INTO workout (athlete_id, name, sport_modality, created_at) "
+            "VALUES (1, 'New', 'running', '2026-02-01 00:00:00.000000')"
+        )
+        assert cursor.lastrowid == 8
@@ -0,0 +1,37 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, unused-argument
+
+import pytest
+
+from workout_api.contrib.pagination import encode_cursor
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_pages_cover_every_row_once(seeded, client):
+    ids = []
+    cursor = None
+    while True:
+        params = {"limit": 300, "order_by": "created_at"}
+        if cursor:
+            params["cursor"] = cursor
+        body = (await client.get("/workouts/", params=params)).json()
+        ids += [item["id"] for item in body["items"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    assert sorted(ids) == list(range(1, 4_001))
+
+
+@pytest.mark.parametrize("path, values", [
+    ("/workouts/", ["x"]),
+    ("/workouts/", [True]),
+    ("/workouts/", [1.5]),
+    ("/athletes/1/workouts", [1, 1]),
+    ("/athletes/1/workouts", ["not a date", 1]),
+    ("/athletes/1/workouts", ["2025-01-01T00:00:00", "1"]),
+])
+async def test_cursor_with_wrong_types_is_rejected(seeded, client, path, values):
+    response = await client.get(path, params={"cursor": encode_cursor(values)})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
@@ -0,0 +1,58 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, unused-argument
+#
+# As consultas quentes têm que usar os índices esperados (EXPLAIN QUERY PLAN).
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select, text
+
+from workout_api.configs.database import database
+from workout_api.contrib.pagination import encode_cursor, keyset
+from workout_api.models.workout import WorkoutModel
+
+pytestmark = pytest.mark.anyio
+
+COLUMNS = [WorkoutModel.created_at, WorkoutModel.id]
+CURSOR = encode_cursor([datetime(2025, 1, 1), 100])
+
+BY_ATHLETE = select(WorkoutModel).where(WorkoutModel.athlete_id == 1)
+BY_ATHLETE_MODALITY = BY_ATHLETE.where(
+    WorkoutModel.sport_modality == "running", WorkoutModel.created_at >= datetime(2024, 1, 1)
+)
+BY_MODALITY = select(WorkoutModel).where(
+    WorkoutModel.sport_modality == "running", WorkoutModel.created_at >= datetime(2024, 1, 1)
+)
+
+HOT_QUERIES = {
+    "athlete workouts": (
+        keyset(BY_ATHLETE, COLUMNS, None, descending=True).limit(51),
+        "ix_workout_athlete_id_created_at",
+    ),
+    "athlete workouts, next page": (
+        keyset(BY_ATHLETE, COLUMNS, CURSOR, descending=True).limit(51),
+        "ix_workout_athlete_id_created_at",
+    ),
+    "athlete workouts by modality": (
+        keyset(BY_ATHLETE_MODALITY, COLUMNS, None, descending=True).limit(51),
+        "ix_workout_athlete_id_created_at",
+    ),
+    "modality range": (
+        BY_MODALITY.order_by(WorkoutModel.created_at.desc()).limit(51),
+        "ix_workout_sport_modality_created_at",
+    ),
+}
+
+
+@pytest.mark.parametrize("name", HOT_QUERIES)
+async def test_hot_query_uses_index(app, name):
+    stmt, index = HOT_QUERIES[name]
+    engine = database.engine
+    sql = str(stmt.compile(engine.sync_engine, compile_kwargs={"literal_binds": True}))
+
+    async with engine.connect() as conn:
+        result = await conn.execute(text("EXPLAIN QUERY PLAN " + sql))
+        plan = " | ".join(row[-1] for row in result)
+
+    assert index in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,82 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, unused-argument
+#
+# Documentos compostos (?include=...) sem N+1: o número de consultas por requisição
+# não pode crescer com o tamanho da página.
+
+import pytest
+from sqlalchemy import event
+
+from workout_api.configs.database import database
+
+pytestmark = pytest.mark.anyio
+
+PAGE_SIZES = (1, 10, 100)
+
+CASES = {
+    "athletes?include=workouts": ("/athletes/", {"include": "workouts", "workouts_limit": 5}),
+    "workouts?include=athlete": ("/workouts/", {"include": "athlete"}),
+}
+
+
+@pytest.fixture
+def executed(seeded):
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    targets = {database.engine.sync_engine, database.read_engine.sync_engine}
+    for target in targets:
+        event.listen(target, "before_cursor_execute", count)
+    yield statements
+    for target in targets:
+        event.remove(target, "before_cursor_execute", count)
+
+
+@pytest.mark.parametrize("name", CASES)
+async def test_include_query_count_is_constant(client, executed, name):
+    path, params = CASES[name]
+    counts = []
+    for size in PAGE_SIZES:
+        executed.clear()
+        response = await client.get(path, params={**params, "limit": size})
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == size
+        counts.append(len(executed))
+
+    assert len(set(counts)) == 1, dict(zip(PAGE_SIZES, counts))
+
+
+async def test_include_workouts_are_the_newest_per_athlete(client, seeded):
+    response = await client.get("/athletes/", params={"include": "workouts", "workouts_limit": 3, "limit": 20})
+    assert response.status_code == 200
+
+    for athlete in response.json()["items"]:
+        expected = await client.get(f"/athletes/{athlete['id']}/workouts", params={"limit": 3})
+        assert [w["id"] for w in athlete["workouts"]] == [w["id"] for w in expected.json()["items"]]
+
+
+async def test_include_workouts_reads_only_the_limit_per_athlete(client, seeded):
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM athlete JOIN workout" in statement:
+            captured.append((statement, parameters))
+
+    target = database.read_engine.sync_engine
+    event.listen(target, "before_cursor_execute", capture)
+    try:
+        response = await client.get("/athletes/", params={"include": "workouts", "limit": 10})
+    finally:
+        event.remove(target, "before_cursor_execute", capture)
+    assert response.status_code == 200
+    assert captured
+
+    statement, parameters = captured[0]
+    async with database.read_engine.connect() as conn:
+        result = await conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+        plan = " | ".join(row[-1] for row in result)
+
+    # um LIMIT por atleta no índice, não uma janela sobre todos os treinos da página
+    assert "CORRELATED LIST SUBQUERY" in plan
+    assert "ix_workout_athlete_id_created_at (athlete_id=?)" in plan
@@ -0,0 +1,39 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, unused-argument
+
+import sqlite3
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def crowded(app, db_path):
+    # muitos "Ana Maria ..." antes (rowids menores) do único "Ana"
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO athlete (name, cpf, age) VALUES (?, ?, ?)",
+            [(f"Ana Maria Souza {i}", f"{i:011d}", 30) for i in range(1, 1_501)],
+        )
+        conn.execute("INSERT INTO athlete (name, cpf, age) VALUES ('Ana', '99999999999', 30)")
+    conn.close()
+
+
+async def test_search_pages_through_every_match_best_first(crowded, client):
+    names = []
+    cursor = None
+    while True:
+        params = {"q": "ana", "limit": 500}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/athletes/search", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        names += [item["name"] for item in body["items"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(names) == 1_501
+    assert names[0] == "Ana"
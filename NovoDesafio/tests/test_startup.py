@@ -0,0 +1,44 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+#
+# Importar workout_api.main (processo novo, sem DATABASE_URL) não pode ler settings,
+# criar engines nem carregar drivers de banco, e tem que caber no orçamento.
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_BUDGET_MS = 1500
+
+# se algum destes aparecer em sys.modules, alguém abriu conexão ou criou engine no import
+FORBIDDEN_MODULES = ("aiosqlite", "asyncpg", "redis")
+
+CHECK = f"""
+import sys
+import workout_api.main
+from workout_api.configs.database import database
+assert database.engine is None, "engine created at import time"
+loaded = [name for name in {FORBIDDEN_MODULES!r} if name in sys.modules]
+assert not loaded, f"imported at import time: {{loaded}}"
+"""
+
+MAIN_IMPORT_TIME = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|\s*workout_api\.main$", re.MULTILINE)
+
+
+def import_main_ms() -> float:
+    env = {key: value for key, value in os.environ.items() if key != "DATABASE_URL"}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHECK],
+        env=env, cwd=ROOT, capture_output=True, text=True, check=False,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return int(MAIN_IMPORT_TIME.search(result.stderr).group(1)) / 1000
+
+
+def test_import_is_side_effect_free_and_within_budget():
+    median = statistics.median(import_main_ms() for _ in range(3))
+    assert median <= IMPORT_BUDGET_MS
@@ -1,21 +1,191 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring, too-few-public-methods
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from functools import lru_cache
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from pydantic_settings import BaseSettings
+from typing import Literal, Optional
+
+from workout_api.contrib.metrics import instrument_engine
+
+# pools das engines (os valores padrão do SQLAlchemy, explícitos para o controle de
+# admissão poder derivar os seus limites deles)
+SERVER_POOL_SIZE = 5
+SERVER_MAX_OVERFLOW = 10
+SQLITE_WRITE_POOL_SIZE = 1
+POOL_TIMEOUT_SECONDS = 30
 
 class Settings(BaseSettings):
     database_url: str
+    db_echo: bool = False
+    db_read_pool_size: int = 5
+    slow_query_ms: Optional[float] = None
+    cache_backend: Literal["local", "redis", "none"] = "local"
+    cache_url: Optional[str] = None
+    cache_ttl_seconds: float = 60
+    cache_max_entries: int = 10_000
+
+    # group commit de POST /workouts/ (opt-in)
+    workout_batch_enabled: bool = False
+    workout_batch_size: int = 100
+    workout_batch_max_delay_ms: float = 5
+
+    # arquivamento: treinos mais antigos que archive_after_days vão para workout_archive
+    # (python -m workout_api.contrib.archive run, ou no app a cada archive_interval_seconds)
+    archive_after_days: int = 180
+    archive_batch_size: int = 1000
+    archive_pause_ms: float = 10
+    archive_interval_seconds: Optional[float] = None
+
+    # controle de admissão: acima do limite a requisição espera numa fila limitada
+    # por até admission_queue_timeout_ms; fila cheia ou prazo estourado -> 503.
+    # Sem limite explícito, cada classe admite tantas requisições quanto o seu pool
+    # tem conexões (ver pool_sizes)
+    admission_enabled: bool = True
+    admission_read_limit: Optional[int] = None
+    admission_read_queue: int = 256
+    admission_write_limit: Optional[int] = None
+    admission_write_queue: int = 128
+    admission_queue_timeout_ms: float = 1000
+    admission_retry_after_seconds: int = 1
+
+    # perfil SQLite (ignorado em outros bancos)
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size_kib: int = 64 * 1024
 
     class Config:
         env_file = ".env"
 
-settings = Settings()
 
-engine = create_async_engine(settings.database_url, echo=True)
-async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+@lru_cache
+def get_settings() -> Settings:
+    # lido na primeira chamada, nunca no import (sem .env e sem DATABASE_URL no import)
+    return Settings()
+
+
+def _sqlite_pragmas(settings: Settings, read_only: bool = False):
+    pragmas = [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size}",
+        f"PRAGMA cache_size=-{settings.sqlite_cache_size_kib}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return on_connect
+
+
+def pool_sizes(settings: Settings) -> tuple[int, int]:
+    # conexões que _create_engines abre para leituras e para escritas; fora do
+    # SQLite as duas classes dividem o mesmo pool
+    if not settings.database_url.startswith("sqlite"):
+        size = SERVER_POOL_SIZE + SERVER_MAX_OVERFLOW
+        return size, size
+    return settings.db_read_pool_size, SQLITE_WRITE_POOL_SIZE
+
+
+def _pool_timeout(settings: Settings) -> float:
+    # com o controle de admissão ligado ninguém espera por uma conexão mais do que
+    # esperaria na fila de admissão
+    if settings.admission_enabled:
+        return min(POOL_TIMEOUT_SECONDS, settings.admission_queue_timeout_ms / 1000)
+    return POOL_TIMEOUT_SECONDS
+
+
+def _create_engines(settings: Settings):
+    pool_timeout = _pool_timeout(settings)
+    if not settings.database_url.startswith("sqlite"):
+        write = create_async_engine(
+            settings.database_url, echo=settings.db_echo,
+            pool_size=SERVER_POOL_SIZE, max_overflow=SERVER_MAX_OVERFLOW, pool_timeout=pool_timeout,
+        )
+        return write, write
+
+    # SQLite aceita um único escritor por vez: todas as escritas passam por uma
+    # conexão só (fila no pool em vez de "database is locked"), e as leituras usam
+    # um pool próprio que, em WAL, não bloqueia nem é bloqueado pelo escritor
+    write = create_async_engine(
+        settings.database_url, echo=settings.db_echo,
+        pool_size=SQLITE_WRITE_POOL_SIZE, max_overflow=0, pool_timeout=pool_timeout,
+    )
+    read = create_async_engine(
+        settings.database_url, echo=settings.db_echo,
+        pool_size=settings.db_read_pool_size, max_overflow=0, pool_timeout=pool_timeout,
+    )
+    event.listen(write.sync_engine, "connect", _sqlite_pragmas(settings))
+    event.listen(read.sync_engine, "connect", _sqlite_pragmas(settings, read_only=True))
+    return write, read
+
+
+class Database:
+    # engines e sessões são criados sob demanda: no lifespan da aplicação ou, em
+    # scripts, no primeiro uso
+    def __init__(self):
+        self._settings: Optional[Settings] = None
+        self.engine: Optional[AsyncEngine] = None
+        self.read_engine: Optional[AsyncEngine] = None
+        self._session = None
+        self._read_session = None
+
+    @property
+    def settings(self) -> Settings:
+        if self._settings is None:
+            self._settings = get_settings()
+        return self._settings
+
+    def configure(self, settings: Settings):
+        if self.engine is not None and settings is not self._settings:
+            raise RuntimeError("Database is already connected with other settings")
+        self._settings = settings
+
+    def connect(self) -> "Database":
+        if self.engine is None:
+            settings = self.settings
+            self.engine, self.read_engine = _create_engines(settings)
+            instrument_engine(self.engine, slow_query_ms=settings.slow_query_ms)
+            if self.read_engine is not self.engine:
+                instrument_engine(self.read_engine, slow_query_ms=settings.slow_query_ms)
+
+            self._session = sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+            self._read_session = sessionmaker(self.read_engine, class_=AsyncSession, expire_on_commit=False)
+        return self
+
+    def session(self) -> AsyncSession:
+        return self.connect()._session()
+
+    def read_session(self) -> AsyncSession:
+        return self.connect()._read_session()
+
+    async def dispose(self):
+        if self.engine is None:
+            return
+        await self.engine.dispose()
+        if self.read_engine is not self.engine:
+            await self.read_engine.dispose()
+        self.engine = self.read_engine = None
+        self._session = self._read_session = None
+
+
+database = Database()
 Base = declarative_base()
 
 async def get_session() -> AsyncSession:
-    async with async_session() as session:
+    async with database.session() as session:
+        yield session
+
+async def get_read_session() -> AsyncSession:
+    async with database.read_session() as session:
         yield session
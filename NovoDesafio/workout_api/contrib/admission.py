@@ -0,0 +1,223 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+#
+# Controle de admissão: leituras e escritas têm limites de concorrência próprios,
+# cada um com uma fila limitada e um prazo de espera. Com a fila cheia (ou o prazo
+# estourado) a requisição recebe 503 + Retry-After na hora, em vez de esperar
+# indefinidamente pelo pool de conexões.
+
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+
+from workout_api.configs.database import Settings, database, pool_sizes
+from workout_api.contrib.metrics import LATENCY_BUCKETS, Counter, Histogram
+
+ADMISSION_ADMITTED = Counter(
+    "admission_admitted_total", "Requests admitted by admission control.", ("route_class",)
+)
+ADMISSION_SHED = Counter(
+    "admission_shed_total", "Requests rejected with 503 by admission control.", ("route_class", "reason")
+)
+ADMISSION_QUEUE_WAIT = Histogram(
+    "admission_queue_wait_seconds", "Time spent waiting for an admission slot.", LATENCY_BUCKETS,
+    ("route_class",),
+)
+ADMISSION_COALESCED = Counter(
+    "admission_coalesced_total", "Requests served by an identical in-flight lookup.", ("resource",)
+)
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# health check e métricas nunca são barrados
+EXEMPT_PATHS = frozenset({"/", "/metrics"})
+
+
+class Overloaded(Exception):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class Limiter:
+    def __init__(self, name: str, limit: int, max_queue: int, timeout: float):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.active = 0
+        self._waiters: deque = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._waiters.clear()
+            self.active = 0
+
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            ADMISSION_ADMITTED.inc(route_class=self.name)
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            ADMISSION_SHED.inc(route_class=self.name, reason="queue_full")
+            raise Overloaded("queue_full")
+
+        start = time.perf_counter()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait((waiter,), timeout=self.timeout)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+        ADMISSION_QUEUE_WAIT.observe(time.perf_counter() - start, route_class=self.name)
+        if not waiter.done():
+            self._abandon(waiter)
+            ADMISSION_SHED.inc(route_class=self.name, reason="timeout")
+            raise Overloaded("timeout")
+        ADMISSION_ADMITTED.inc(route_class=self.name)
+
+    def _abandon(self, waiter: asyncio.Future):
+        if waiter.done():
+            # a vaga já tinha sido repassada para esta requisição: devolve para a próxima
+            self.release()
+        else:
+            waiter.cancel()
+            self._waiters.remove(waiter)
+
+    def release(self):
+        # a vaga passa direto para o próximo da fila (FIFO) sem decrementar `active`
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+def admission_limits(settings: Settings) -> tuple[int, int]:
+    # por padrão, uma requisição admitida por conexão do pool: o excedente espera na
+    # fila de admissão (com prazo e 503), não no pool. No group commit um lote
+    # inteiro de POST usa uma conexão só
+    read_pool, write_pool = pool_sizes(settings)
+    read_limit = settings.admission_read_limit
+    if read_limit is None:
+        read_limit = read_pool
+    write_limit = settings.admission_write_limit
+    if write_limit is None:
+        write_limit = write_pool * (settings.workout_batch_size if settings.workout_batch_enabled else 1)
+    return read_limit, write_limit
+
+
+async def pool_exhausted(request: Request, exc: PoolTimeout):
+    # o pool não liberou conexão dentro do prazo de admissão: mesma resposta da fila cheia
+    route_class = "read" if request.method in READ_METHODS else "write"
+    ADMISSION_SHED.inc(route_class=route_class, reason="pool_timeout")
+    return JSONResponse(
+        {"detail": "Server overloaded, retry later"},
+        status_code=503,
+        headers={"Retry-After": str(admission.retry_after)},
+    )
+
+
+class AdmissionControl:
+    def __init__(self):
+        self.enabled = True
+        self.retry_after = 1
+        self.limiters: Optional[dict[str, Limiter]] = None
+
+    def configure(self, settings: Settings):
+        timeout = settings.admission_queue_timeout_ms / 1000
+        read_limit, write_limit = admission_limits(settings)
+        self.enabled = settings.admission_enabled
+        self.retry_after = settings.admission_retry_after_seconds
+        self.limiters = {
+            "read": Limiter("read", read_limit, settings.admission_read_queue, timeout),
+            "write": Limiter("write", write_limit, settings.admission_write_queue, timeout),
+        }
+
+    def limiter(self, method: str) -> Optional[Limiter]:
+        if self.limiters is None:
+            self.configure(database.settings)
+        if not self.enabled:
+            return None
+        return self.limiters["read" if method in READ_METHODS else "write"]
+
+
+admission = AdmissionControl()
+
+
+class AdmissionMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        limiter = admission.limiter(scope["method"])
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await limiter.acquire()
+        except Overloaded:
+            await self._reject(send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    @staticmethod
+    async def _reject(send):
+        body = json.dumps({"detail": "Server overloaded, retry later"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(admission.retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+class SingleFlight:
+    # consultas idênticas simultâneas (mesma chave) compartilham uma única execução;
+    # a execução roda numa task própria, então o cancelamento de quem a iniciou
+    # (cliente desconectou) não derruba as outras requisições que estão esperando
+    def __init__(self):
+        self._calls: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, resource: str, fn: Callable[[], Awaitable]):
+        task = self._calls.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            ADMISSION_COALESCED.inc(resource=resource)
+        else:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # marca como lida mesmo que ninguém mais esteja esperando
+
+
+single_flight = SingleFlight()
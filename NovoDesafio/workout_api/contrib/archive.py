@@ -0,0 +1,208 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+#
+# Arquivamento de treinos antigos: as linhas mais antigas que ARCHIVE_AFTER_DAYS
+# saem da tabela workout (quente) para workout_archive em lotes pequenos, cada um
+# na sua própria transação curta, e os totais por atleta/modalidade do que foi
+# arquivado vão para workout_archive_rollup. As estatísticas (workout_stats) não
+# mudam: o treino só troca de tabela.
+#
+#   python -m workout_api.contrib.archive run [--after-days N] [--batch-size N]
+#   python -m workout_api.contrib.archive rebuild-rollups
+
+import argparse
+import asyncio
+import logging
+import sys
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Optional
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.configs.database import Settings, database
+from workout_api.contrib.metrics import Counter
+from workout_api.contrib.stats import dialect_insert, week_start
+from workout_api.models.archive import WorkoutArchiveModel, WorkoutRollupModel
+from workout_api.models.workout import WorkoutModel
+
+logger = logging.getLogger("workout_api.archive")
+
+ARCHIVE_MOVED = Counter("workout_archive_moved_total", "Workouts moved to the archive.")
+
+rollup_table = WorkoutRollupModel.__table__
+
+ARCHIVE_COLUMNS = ["id", "athlete_id", "name", "sport_modality", "created_at"]
+
+
+@dataclass
+class ArchiveHorizon:
+    # o ponto mais "novo" do arquivo: nenhuma linha arquivada passa destes valores
+    max_id: int
+    max_created_at: datetime
+
+
+def archive_cutoff(now: datetime, after_days: int) -> datetime:
+    # alinhado ao início da semana: um bucket semanal de workout_stats nunca fica
+    # dividido entre as duas tabelas
+    return datetime.combine(week_start(now - timedelta(days=after_days)), time.min)
+
+
+async def archive_horizon(db: AsyncSession) -> Optional[ArchiveHorizon]:
+    # dois max() resolvidos pelos índices (PK e created_at), sem varrer o arquivo
+    result = await db.execute(select(
+        select(func.max(WorkoutArchiveModel.id)).scalar_subquery(),
+        select(func.max(WorkoutArchiveModel.created_at)).scalar_subquery(),
+    ))
+    max_id, max_created_at = result.one()
+    if max_id is None:
+        return None
+    return ArchiveHorizon(max_id, max_created_at)
+
+
+async def archived_until(
+    db: AsyncSession, athlete_id: int, sport_modality: Optional[str] = None
+) -> Optional[datetime]:
+    # treino arquivado mais recente do atleta, direto das rollups (PK athlete_id, modalidade)
+    stmt = select(func.max(WorkoutRollupModel.last_workout_at)).where(
+        WorkoutRollupModel.athlete_id == athlete_id
+    )
+    if sport_modality is not None:
+        stmt = stmt.where(WorkoutRollupModel.sport_modality == sport_modality)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def record_rollups(db: AsyncSession, rows):
+    totals = {}
+    for row in rows:
+        key = (row.athlete_id, row.sport_modality)
+        count, first, last = totals.get(key, (0, row.created_at, row.created_at))
+        totals[key] = (count + 1, min(first, row.created_at), max(last, row.created_at))
+
+    stmt = dialect_insert(db.bind.dialect.name, rollup_table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[rollup_table.c.athlete_id, rollup_table.c.sport_modality],
+        set_={
+            "workout_count": rollup_table.c.workout_count + stmt.excluded.workout_count,
+            "first_workout_at": case(
+                (stmt.excluded.first_workout_at < rollup_table.c.first_workout_at, stmt.excluded.first_workout_at),
+                else_=rollup_table.c.first_workout_at,
+            ),
+            "last_workout_at": case(
+                (stmt.excluded.last_workout_at > rollup_table.c.last_workout_at, stmt.excluded.last_workout_at),
+                else_=rollup_table.c.last_workout_at,
+            ),
+        },
+    )
+    await db.execute(stmt, [
+        {
+            "athlete_id": athlete_id,
+            "sport_modality": sport_modality,
+            "workout_count": count,
+            "first_workout_at": first,
+            "last_workout_at": last,
+        }
+        for (athlete_id, sport_modality), (count, first, last) in totals.items()
+    ])
+
+
+async def archive_batch(db: AsyncSession, cutoff: datetime, after_id: int, batch_size: int) -> list:
+    # o lote começa pelo DELETE ... RETURNING: a transação já nasce como escrita (no
+    # SQLite não precisa "promover" uma leitura) e as linhas ficam presas a este lote.
+    # Percorre a tabela quente pela PK (after_id), então a execução inteira lê cada
+    # linha uma vez só, sem precisar de índice em created_at. Os ids da tabela quente
+    # são monotônicos (AUTOINCREMENT), então nenhum id arquivado volta a ser gerado
+    chunk = (
+        select(WorkoutModel.id)
+        .where(WorkoutModel.id > after_id, WorkoutModel.created_at < cutoff)
+        .order_by(WorkoutModel.id)
+        .limit(batch_size)
+    )
+    result = await db.execute(
+        delete(WorkoutModel)
+        .where(WorkoutModel.id.in_(chunk))
+        .returning(*(getattr(WorkoutModel, name) for name in ARCHIVE_COLUMNS))
+        .execution_options(synchronize_session=False)
+    )
+    rows = sorted(result.all(), key=lambda row: row.id)
+    if not rows:
+        return rows
+
+    await db.execute(insert(WorkoutArchiveModel), [row._asdict() for row in rows])
+    await record_rollups(db, rows)
+    return rows
+
+
+async def archive_workouts(cutoff: datetime, batch_size: int, pause_ms: float = 0) -> int:
+    # um lote por transação: a conexão de escrita fica presa só o tempo de um lote,
+    # e a pausa entre lotes deixa as escritas da API passarem na frente
+    moved = 0
+    after_id = 0
+    while True:
+        async with database.session() as db:
+            rows = await archive_batch(db, cutoff, after_id, batch_size)
+            await db.commit()
+
+        if not rows:
+            return moved
+
+        moved += len(rows)
+        after_id = rows[-1].id
+        ARCHIVE_MOVED.inc(len(rows))
+        await asyncio.sleep(pause_ms / 1000)
+
+
+async def archive_periodically(settings: Settings):
+    while True:
+        cutoff = archive_cutoff(datetime.utcnow(), settings.archive_after_days)
+        try:
+            moved = await archive_workouts(cutoff, settings.archive_batch_size, settings.archive_pause_ms)
+            if moved:
+                logger.info("archived %d workouts older than %s", moved, cutoff)
+        except SQLAlchemyError:
+            logger.exception("workout archival failed")
+        await asyncio.sleep(settings.archive_interval_seconds)
+
+
+async def rebuild_rollups(db: AsyncSession):
+    await db.execute(delete(rollup_table))
+    await db.execute(
+        insert(rollup_table).from_select(
+            ["athlete_id", "sport_modality", "workout_count", "first_workout_at", "last_workout_at"],
+            select(
+                WorkoutArchiveModel.athlete_id,
+                WorkoutArchiveModel.sport_modality,
+                func.count(),
+                func.min(WorkoutArchiveModel.created_at),
+                func.max(WorkoutArchiveModel.created_at),
+            ).group_by(WorkoutArchiveModel.athlete_id, WorkoutArchiveModel.sport_modality),
+        )
+    )
+
+
+async def _main(argv: list[str]) -> int:
+    settings = database.settings
+    parser = argparse.ArgumentParser(prog="python -m workout_api.contrib.archive")
+    parser.add_argument("command", choices=("run", "rebuild-rollups"))
+    parser.add_argument("--after-days", type=int, default=settings.archive_after_days)
+    parser.add_argument("--batch-size", type=int, default=settings.archive_batch_size)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        cutoff = archive_cutoff(datetime.utcnow(), args.after_days)
+        moved = await archive_workouts(cutoff, args.batch_size, settings.archive_pause_ms)
+        print(f"archived {moved} workouts older than {cutoff}")
+    else:
+        async with database.session() as db:
+            await rebuild_rollups(db)
+            await db.commit()
+        print("workout_archive_rollup rebuilt")
+
+    await database.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main(sys.argv[1:])))
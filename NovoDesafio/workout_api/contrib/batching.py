@@ -0,0 +1,136 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+#
+# Group commit para criação de treinos: requisições concorrentes entram numa fila
+# e são gravadas juntas, numa única transação (um fsync) por lote.
+
+import asyncio
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.configs.database import database
+from workout_api.contrib.metrics import Counter, Histogram
+from workout_api.contrib.stats import record_workouts
+from workout_api.models.athlete import AthleteModel
+from workout_api.models.workout import WorkoutModel
+from workout_api.schemas.workout import WorkoutIn, WorkoutOut
+
+BATCH_SIZE = Histogram(
+    "workout_batch_size", "Workouts written per group commit.", (1, 2, 5, 10, 20, 50, 100, 200, 500)
+)
+BATCH_FAILURES = Counter("workout_batch_failures_total", "Group commits that failed.")
+
+
+async def insert_workouts(db: AsyncSession, items: list[WorkoutIn]) -> list[Optional[WorkoutOut]]:
+    # um IN para validar os atletas + um INSERT ... RETURNING para o lote todo;
+    # devolve None nas posições cujo atleta não existe
+    athlete_ids = {item.athlete_id for item in items}
+    result = await db.execute(select(AthleteModel.id).where(AthleteModel.id.in_(athlete_ids)))
+    known = set(result.scalars().all())
+
+    rows = [item.model_dump() for item in items if item.athlete_id in known]
+    if not rows:
+        return [None] * len(items)
+
+    result = await db.execute(
+        insert(WorkoutModel).returning(
+            WorkoutModel.id,
+            WorkoutModel.athlete_id,
+            WorkoutModel.name,
+            WorkoutModel.sport_modality,
+            WorkoutModel.created_at,
+            sort_by_parameter_order=True,
+        ),
+        rows,
+    )
+    created = iter([WorkoutOut.model_validate(row._mapping) for row in result.all()])
+    outputs = [next(created) if item.athlete_id in known else None for item in items]
+
+    await record_workouts(
+        db, [(out.athlete_id, out.sport_modality, out.created_at) for out in outputs if out]
+    )
+    return outputs
+
+
+class WorkoutBatcher:
+    def __init__(self, max_batch_size: Optional[int] = None, max_delay_ms: Optional[float] = None):
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000 if max_delay_ms is not None else None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def configure(self, max_batch_size: int, max_delay_ms: float):
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000
+
+    async def submit(self, data: WorkoutIn) -> WorkoutOut:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            if self.max_batch_size is None:
+                settings = database.settings
+                self.configure(settings.workout_batch_size, settings.workout_batch_max_delay_ms)
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+
+        future = loop.create_future()
+        await self._queue.put((data, future))
+        return await future
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _collect(self) -> list:
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_delay
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self):
+        while True:
+            # enquanto um lote é gravado o próximo já vai se acumulando na fila
+            await self._flush(await self._collect())
+
+    async def _flush(self, batch: list):
+        # requisições canceladas (cliente desconectou) não entram no lote
+        batch = [(data, future) for data, future in batch if not future.done()]
+        if not batch:
+            return
+
+        BATCH_SIZE.observe(len(batch))
+        try:
+            async with database.session() as db:
+                outputs = await insert_workouts(db, [data for data, _ in batch])
+                await db.commit()
+        except Exception as exc:  # pylint: disable=broad-except
+            BATCH_FAILURES.inc()
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), output in zip(batch, outputs):
+            if future.done():
+                continue
+            if output is None:
+                future.set_exception(HTTPException(status_code=404, detail="Athlete not found"))
+            else:
+                future.set_result(output)
+
+
+# tamanho e espera vêm das settings: configurado no lifespan ou no primeiro submit
+workout_batcher = WorkoutBatcher()
@@ -0,0 +1,242 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring, import-outside-toplevel
+
+import hashlib
+import itertools
+import time
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from workout_api.configs.database import Settings, database
+
+
+# Invalidação: cada escrita apaga a chave e grava para ela uma versão nova (de um
+# contador que só cresce). A leitura que foi ao banco anota a versão antes do SELECT
+# e só grava no cache se ela não mudou; senão uma escrita confirmada durante o SELECT
+# seria sobrescrita pela linha antiga. Os registros de versão duram o TTL, e uma
+# leitura mais lenta que isso não grava.
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def set(self, key: str, value: bytes) -> None: ...
+
+    async def delete(self, *keys: str) -> None: ...
+
+    async def version(self, key: str) -> int: ...
+
+    async def set_if_version(self, key: str, value: bytes, version: int, started: float) -> None: ...
+
+    async def invalidate(self, *keys: str) -> None: ...
+
+
+class NullCache:
+    async def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    async def set(self, key: str, value: bytes) -> None:
+        return None
+
+    async def delete(self, *keys: str) -> None:
+        return None
+
+    async def version(self, key: str) -> int:
+        return 0
+
+    async def set_if_version(self, key: str, value: bytes, version: int, started: float) -> None:
+        return None
+
+    async def invalidate(self, *keys: str) -> None:
+        return None
+
+
+class LocalCache:
+    # LRU com TTL, restrito a um processo: com vários workers use o backend redis
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._versions: OrderedDict[str, tuple[float, int]] = OrderedDict()
+        self._counter = itertools.count(1)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def version(self, key: str) -> int:
+        entry = self._versions.get(key)
+        return entry[1] if entry else 0
+
+    async def set_if_version(self, key: str, value: bytes, version: int, started: float) -> None:
+        if time.monotonic() - started < self.ttl and await self.version(key) == version:
+            await self.set(key, value)
+
+    async def invalidate(self, *keys: str) -> None:
+        now = time.monotonic()
+        for key in keys:
+            self._entries.pop(key, None)
+            self._versions[key] = (now, next(self._counter))
+            self._versions.move_to_end(key)
+
+        # em ordem de invalidação: as mais antigas que o TTL não barram mais nenhuma leitura
+        while self._versions and next(iter(self._versions.values()))[0] <= now - self.ttl:
+            self._versions.popitem(last=False)
+
+
+# versão nova para cada chave + DEL da entrada, atômico e compartilhado entre workers
+REDIS_INVALIDATE = """
+local version = redis.call('INCR', KEYS[1])
+for i = 2, #KEYS, 2 do
+    redis.call('DEL', KEYS[i])
+    redis.call('SET', KEYS[i + 1], version, 'PX', ARGV[1])
+end
+"""
+
+REDIS_SET_IF_VERSION = """
+if (redis.call('GET', KEYS[2]) or '0') == ARGV[2] then
+    redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[3])
+end
+"""
+
+
+class RedisCache:
+    def __init__(self, url: str, ttl: float, prefix: str = "workout_api:"):
+        try:
+            from redis import asyncio as redis
+        except ImportError as exc:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from exc
+
+        self.client = redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+        self._invalidate = self.client.register_script(REDIS_INVALIDATE)
+        self._set_if_version = self.client.register_script(REDIS_SET_IF_VERSION)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        await self.client.set(self.prefix + key, value, px=int(self.ttl * 1000))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+    def _version_key(self, key: str) -> str:
+        return self.prefix + "version:" + key
+
+    async def version(self, key: str) -> int:
+        return int(await self.client.get(self._version_key(key)) or 0)
+
+    async def set_if_version(self, key: str, value: bytes, version: int, started: float) -> None:
+        if time.monotonic() - started < self.ttl:
+            await self._set_if_version(
+                keys=[self.prefix + key, self._version_key(key)],
+                args=[value, version, int(self.ttl * 1000)],
+            )
+
+    async def invalidate(self, *keys: str) -> None:
+        if keys:
+            names = [self.prefix + "version"]
+            for key in keys:
+                names += [self.prefix + key, self._version_key(key)]
+            await self._invalidate(keys=names, args=[int(self.ttl * 1000)])
+
+
+def build_cache(settings: Settings) -> CacheBackend:
+    if settings.cache_backend == "redis":
+        return RedisCache(settings.cache_url, settings.cache_ttl_seconds)
+    if settings.cache_backend == "local":
+        return LocalCache(settings.cache_max_entries, settings.cache_ttl_seconds)
+    return NullCache()
+
+
+class Cache:
+    # ponto fixo importado pelos routers; o backend é escolhido no lifespan
+    # (configure) ou, sem ele, no primeiro uso a partir das settings do banco
+    def __init__(self):
+        self._backend: Optional[CacheBackend] = None
+
+    @property
+    def backend(self) -> CacheBackend:
+        if self._backend is None:
+            self._backend = build_cache(database.settings)
+        return self._backend
+
+    def configure(self, settings: Settings):
+        self._backend = build_cache(settings)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.backend.get(key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        await self.backend.set(key, value)
+
+    async def delete(self, *keys: str) -> None:
+        await self.backend.delete(*keys)
+
+    async def version(self, key: str) -> tuple[int, float]:
+        # anotada antes de ir ao banco e devolvida em fill()
+        return await self.backend.version(key), time.monotonic()
+
+    async def fill(self, key: str, value: bytes, version: tuple[int, float]) -> None:
+        # grava o resultado de uma leitura só se nenhuma escrita invalidou a chave depois de version()
+        await self.backend.set_if_version(key, value, *version)
+
+    async def invalidate(self, *keys: str) -> None:
+        await self.backend.invalidate(*keys)
+
+
+cache = Cache()
+
+
+def athlete_key(athlete_id: int) -> str:
+    return f"athlete:{athlete_id}"
+
+
+def workout_key(workout_id: int) -> str:
+    return f"workout:{workout_id}"
+
+
+def encode_entry(model: BaseModel) -> bytes:
+    # a ETag é o hash da própria linha serializada: muda sempre que a linha muda
+    body = model.model_dump_json().encode()
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    return etag.encode() + b"\n" + body
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def cached_response(entry: bytes, request: Request) -> Response:
+    etag, body = entry.split(b"\n", 1)
+    etag = etag.decode()
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
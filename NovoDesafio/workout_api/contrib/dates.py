@@ -0,0 +1,37 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+#
+# Filtros de data (created_from / created_to): created_at é gravado em UTC sem fuso
+# (datetime.utcnow), então um valor com fuso ("...Z", "-03:00") vira UTC sem fuso
+# antes de chegar às consultas e às comparações com os limites do arquivo.
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass
+class CreatedRange:
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+    def where(self, stmt, model):
+        if self.created_from is not None:
+            stmt = stmt.where(model.created_at >= self.created_from)
+        if self.created_to is not None:
+            stmt = stmt.where(model.created_at < self.created_to)
+        return stmt
+
+    def reaches(self, moment: datetime) -> bool:
+        # o intervalo alcança linhas de até `moment` (ex.: o treino arquivado mais novo)
+        return self.created_from is None or self.created_from <= moment
+
+
+def created_range(created_from: Optional[datetime] = None, created_to: Optional[datetime] = None) -> CreatedRange:
+    # dependência compartilhada pelas rotas que filtram por created_at
+    return CreatedRange(naive_utc(created_from), naive_utc(created_to))
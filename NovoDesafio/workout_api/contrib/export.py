@@ -0,0 +1,60 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Literal
+
+from fastapi.responses import StreamingResponse
+
+from workout_api.configs.database import database
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_CHUNK_SIZE = 1000
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _ndjson_chunk(rows) -> str:
+    return "".join(json.dumps(dict(row._mapping), default=_json_default) + "\n" for row in rows)
+
+
+def _csv_chunk(rows) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        [value.isoformat() if isinstance(value, datetime) else value for value in row]
+        for row in rows
+    )
+    return buffer.getvalue()
+
+
+async def _stream_rows(stmt, fmt: ExportFormat):
+    # sessão própria: o gerador roda depois que a dependência get_session já foi encerrada
+    async with database.read_session() as db:
+        result = await db.stream(stmt.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+
+        if fmt == "csv":
+            yield _csv_chunk([result.keys()])
+
+        async for rows in result.partitions():
+            yield _ndjson_chunk(rows) if fmt == "ndjson" else _csv_chunk(rows)
+
+
+def export_response(stmt, fmt: ExportFormat, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        _stream_rows(stmt, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
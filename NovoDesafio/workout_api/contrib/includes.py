@@ -0,0 +1,92 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+#
+# Documentos compostos (?include=...): os relacionamentos de uma página inteira são
+# carregados em consultas IN por página (no máximo uma por tabela), nunca uma
+# consulta por item (N+1).
+
+from sqlalchemy import select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from workout_api.contrib.pagination import select_fields
+from workout_api.models.archive import WorkoutArchiveModel
+from workout_api.models.athlete import AthleteModel
+from workout_api.models.workout import WorkoutModel
+from workout_api.schemas.athlete import AthleteOut
+from workout_api.schemas.workout import WorkoutOut
+
+DEFAULT_INCLUDED_WORKOUTS = 5
+MAX_INCLUDED_WORKOUTS = 50
+
+
+async def _latest_workouts(db: AsyncSession, model, athlete_ids: set, limit: int) -> list[dict]:
+    # os `limit` treinos mais recentes de cada atleta: um LIMIT por atleta no índice
+    # (athlete_id, created_at), então só essas linhas são lidas, não o histórico todo
+    # (selectinload não sabe limitar por pai)
+    if db.bind.dialect.name == "postgresql":
+        latest = (
+            select_fields(model, WorkoutOut)
+            .where(model.athlete_id == AthleteModel.id)
+            .order_by(model.created_at.desc(), model.id.desc())
+            .limit(limit)
+            .lateral("latest")
+        )
+        stmt = (
+            select(*(latest.c[name] for name in WorkoutOut.model_fields))
+            .select_from(AthleteModel)
+            .join(latest, true())
+        )
+        order = (latest.c.athlete_id, latest.c.created_at.desc(), latest.c.id.desc())
+    else:
+        # SQLite não tem LATERAL: a subquery correlacionada do IN roda uma vez por atleta
+        inner = aliased(model)
+        latest = (
+            select(inner.id)
+            .where(inner.athlete_id == AthleteModel.id)
+            .order_by(inner.created_at.desc(), inner.id.desc())
+            .limit(limit)
+            .correlate(AthleteModel)
+        )
+        stmt = select_fields(model, WorkoutOut).select_from(AthleteModel).join(model, model.id.in_(latest))
+        order = (model.athlete_id, model.created_at.desc(), model.id.desc())
+
+    result = await db.execute(stmt.where(AthleteModel.id.in_(athlete_ids)).order_by(*order))
+    keys = list(result.keys())
+    return [dict(zip(keys, row)) for row in result.all()]
+
+
+async def attach_workouts(db: AsyncSession, athletes: list[dict], limit: int) -> list[dict]:
+    for athlete in athletes:
+        athlete["workouts"] = []
+    if not athletes:
+        return athletes
+
+    by_id = {athlete["id"]: athlete for athlete in athletes}
+    for workout in await _latest_workouts(db, WorkoutModel, set(by_id), limit):
+        by_id[workout["athlete_id"]]["workouts"].append(workout)
+
+    # só quem não completou o limite com treinos recentes vai ao arquivo, e numa
+    # única consulta para a página toda
+    short = {athlete_id for athlete_id, athlete in by_id.items() if len(athlete["workouts"]) < limit}
+    if short:
+        for workout in await _latest_workouts(db, WorkoutArchiveModel, short, limit):
+            workouts = by_id[workout["athlete_id"]]["workouts"]
+            if len(workouts) < limit:
+                workouts.append(workout)
+    return athletes
+
+
+async def attach_athletes(db: AsyncSession, workouts: list[dict]) -> list[dict]:
+    athlete_ids = {workout["athlete_id"] for workout in workouts}
+    if not athlete_ids:
+        return workouts
+
+    result = await db.execute(
+        select_fields(AthleteModel, AthleteOut).where(AthleteModel.id.in_(athlete_ids))
+    )
+    keys = list(result.keys())
+    athletes = {athlete["id"]: athlete for athlete in (dict(zip(keys, row)) for row in result.all())}
+
+    for workout in workouts:
+        workout["athlete"] = athletes[workout["athlete_id"]]
+    return workouts
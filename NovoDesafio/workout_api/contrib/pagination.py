@@ -0,0 +1,117 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Generic, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+from pydantic_core import to_json
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.contrib.dates import naive_utc
+
+T = TypeVar("T")
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(values: Sequence) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _cursor_value(column, value):
+    # o valor tem que ser do tipo da coluna: um cursor forjado não chega ao banco
+    python_type = column.type.python_type
+    if python_type is datetime:
+        if not isinstance(value, str):
+            raise TypeError(value)
+        return naive_utc(datetime.fromisoformat(value))
+    if isinstance(value, bool):
+        raise TypeError(value)
+    if python_type is float and isinstance(value, int):
+        return float(value)
+    if not isinstance(value, python_type):
+        raise TypeError(value)
+    return value
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError(cursor)
+        return [_cursor_value(column, value) for column, value in zip(columns, values)]
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+def keyset(stmt, columns: Sequence, cursor: Optional[str], descending: bool = False):
+    # a ordenação tem que ser total, por isso a última coluna deve ser sempre a PK
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        key = tuple_(*columns)
+        stmt = stmt.where(key < tuple_(*values) if descending else key > tuple_(*values))
+
+    order = [column.desc() if descending else column.asc() for column in columns]
+    return stmt.order_by(*order)
+
+
+def select_fields(model, schema: type[BaseModel]):
+    # seleciona só as colunas que o schema de saída usa, como tuplas (sem ORM)
+    return select(*(getattr(model, name) for name in schema.model_fields))
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt,
+    columns: Sequence,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_LIMIT,
+    descending: bool = False,
+) -> dict:
+    result = await db.execute(keyset(stmt, columns, cursor, descending).limit(limit + 1))
+    keys = list(result.keys())
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = dict(zip(keys, rows[-1]))
+        next_cursor = encode_cursor([last[column.key] for column in columns])
+
+    return {"items": [dict(zip(keys, row)) for row in rows], "next_cursor": next_cursor}
+
+
+def merge_pages(pages: Sequence[dict], columns: Sequence, limit: int, descending: bool = False) -> dict:
+    # junta páginas da mesma consulta em tabelas diferentes (quente + arquivo); cada
+    # uma já veio cortada pelo mesmo cursor, então o próximo cursor vale para as duas
+    items = sorted(
+        (item for page in pages for item in page["items"]),
+        key=lambda item: tuple(item[column.key] for column in columns),
+        reverse=descending,
+    )
+
+    next_cursor = None
+    if len(items) > limit or any(page["next_cursor"] for page in pages):
+        items = items[:limit]
+        next_cursor = encode_cursor([items[-1][column.key] for column in columns])
+
+    return {"items": items, "next_cursor": next_cursor}
+
+
+def page_response(page: dict) -> Response:
+    # as linhas já vêm do banco com os tipos do schema (select_fields): serializa a
+    # página inteira de uma vez, sem a segunda validação do response_model
+    return Response(content=to_json(page), media_type="application/json")
@@ -0,0 +1,76 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+#
+# Busca de atletas por nome. No SQLite usa a tabela virtual FTS5 athlete_fts,
+# mantida em sincronia com athlete por triggers; no PostgreSQL usa ILIKE +
+# similarity() apoiados num índice GIN de trigramas (pg_trgm).
+
+import re
+
+from sqlalchemy import DDL, Float, Integer, column, event, func, literal_column, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.models.athlete import AthleteModel
+
+athlete_fts = table("athlete_fts", column("rowid", Integer))
+
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS athlete_fts USING fts5("
+    "name, content='athlete', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER IF NOT EXISTS athlete_fts_ai AFTER INSERT ON athlete BEGIN "
+    "INSERT INTO athlete_fts(rowid, name) VALUES (new.id, new.name); END",
+    "CREATE TRIGGER IF NOT EXISTS athlete_fts_ad AFTER DELETE ON athlete BEGIN "
+    "INSERT INTO athlete_fts(athlete_fts, rowid, name) VALUES ('delete', old.id, old.name); END",
+    "CREATE TRIGGER IF NOT EXISTS athlete_fts_au AFTER UPDATE OF name ON athlete BEGIN "
+    "INSERT INTO athlete_fts(athlete_fts, rowid, name) VALUES ('delete', old.id, old.name); "
+    "INSERT INTO athlete_fts(rowid, name) VALUES (new.id, new.name); END",
+]
+
+POSTGRES_TRGM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_athlete_name_trgm ON athlete USING gin (name gin_trgm_ops)",
+]
+
+# mantém Base.metadata.create_all (benchmarks, bancos novos) igual ao schema das migrações
+for _statement in SQLITE_FTS_DDL:
+    event.listen(AthleteModel.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in POSTGRES_TRGM_DDL:
+    event.listen(AthleteModel.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
+def search_terms(query: str) -> list[str]:
+    return re.findall(r"\w+", query)
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_statement(db: AsyncSession, terms: list[str]):
+    # subquery com uma coluna "rank" (menor = mais relevante) para paginar por (rank, id).
+    # Todos os candidatos são ranqueados: cortar antes de ordenar pelo rank perderia os
+    # melhores resultados (a ordem do corte seria a do rowid, não a da relevância)
+    if db.bind.dialect.name == "postgresql":
+        query = " ".join(terms)
+        candidates = select(
+            AthleteModel.id.label("id"),
+            (1 - func.similarity(AthleteModel.name, query, type_=Float)).label("rank"),
+        ).where(
+            *(AthleteModel.name.ilike(f"%{_escape_like(term)}%", escape="\\") for term in terms)
+        )
+    else:
+        # MATCH e bm25() recebem o nome da tabela virtual, não uma coluna
+        fts = literal_column("athlete_fts")
+        match = " ".join(f'"{term}"*' for term in terms)
+        candidates = select(
+            athlete_fts.c.rowid.label("id"),
+            func.bm25(fts, type_=Float).label("rank"),
+        ).where(fts.match(match))
+
+    candidates = candidates.subquery("candidates")
+    ranked = (
+        select(AthleteModel.id, AthleteModel.name, AthleteModel.cpf, AthleteModel.age, candidates.c.rank)
+        .join(candidates, candidates.c.id == AthleteModel.id)
+        .subquery("ranked")
+    )
+    return select(ranked), [ranked.c.rank, ranked.c.id]
@@ -0,0 +1,166 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+#
+# Estatísticas por atleta / modalidade / semana mantidas incrementalmente pelas
+# rotas de escrita de treinos, na mesma transação do INSERT/UPDATE/DELETE.
+#
+# Para reconstruir a tabela a partir dos treinos existentes:
+#
+#   python -m workout_api.contrib.stats rebuild
+
+import asyncio
+import sys
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, case, delete, func, insert, literal_column, select, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.configs.database import database
+from workout_api.models.archive import WorkoutArchiveModel
+from workout_api.models.stats import WorkoutStatsModel
+from workout_api.models.workout import WorkoutModel
+
+stats_table = WorkoutStatsModel.__table__
+
+# (athlete_id, sport_modality, created_at)
+WorkoutKey = tuple[int, str, Optional[datetime]]
+
+
+def week_start(value: datetime) -> date:
+    return (value - timedelta(days=value.weekday())).date()
+
+
+def _buckets(rows: Iterable[WorkoutKey]) -> dict:
+    buckets = {}
+    for athlete_id, sport_modality, created_at in rows:
+        if created_at is None:
+            continue
+        key = (athlete_id, sport_modality, week_start(created_at))
+        count, last = buckets.get(key, (0, created_at))
+        buckets[key] = (count + 1, max(last, created_at))
+    return buckets
+
+
+def _bucket_filter(athlete_id: int, sport_modality: str, period_start: date):
+    return and_(
+        stats_table.c.athlete_id == athlete_id,
+        stats_table.c.sport_modality == sport_modality,
+        stats_table.c.period_start == period_start,
+    )
+
+
+def dialect_insert(dialect_name: str, table):
+    # INSERT com on_conflict_do_update; import tardio: o dialeto do postgresql
+    # custa ~50 ms no import da aplicação
+    # pylint: disable=import-outside-toplevel
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects import postgresql
+        return postgresql.insert(table)
+    from sqlalchemy.dialects import sqlite
+    return sqlite.insert(table)
+
+
+async def record_workouts(db: AsyncSession, rows: Iterable[WorkoutKey]):
+    buckets = _buckets(rows)
+    if not buckets:
+        return
+
+    stmt = dialect_insert(db.bind.dialect.name, stats_table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[stats_table.c.athlete_id, stats_table.c.sport_modality, stats_table.c.period_start],
+        set_={
+            "workout_count": stats_table.c.workout_count + stmt.excluded.workout_count,
+            "last_workout_at": case(
+                (stmt.excluded.last_workout_at > stats_table.c.last_workout_at, stmt.excluded.last_workout_at),
+                else_=stats_table.c.last_workout_at,
+            ),
+        },
+    )
+    await db.execute(stmt, [
+        {
+            "athlete_id": athlete_id,
+            "sport_modality": sport_modality,
+            "period_start": period_start,
+            "workout_count": count,
+            "last_workout_at": last,
+        }
+        for (athlete_id, sport_modality, period_start), (count, last) in buckets.items()
+    ])
+
+
+async def remove_workouts(db: AsyncSession, rows: Iterable[WorkoutKey]):
+    # precisa rodar depois do DELETE/UPDATE dos treinos: o last_workout_at do
+    # bucket é recalculado a partir do que sobrou (via índice athlete_id, created_at)
+    for (athlete_id, sport_modality, period_start), (count, _) in _buckets(rows).items():
+        start = datetime.combine(period_start, time.min)
+        latest = select(func.max(WorkoutModel.created_at)).where(
+            WorkoutModel.athlete_id == athlete_id,
+            WorkoutModel.sport_modality == sport_modality,
+            WorkoutModel.created_at >= start,
+            WorkoutModel.created_at < start + timedelta(days=7),
+        ).scalar_subquery()
+
+        bucket = _bucket_filter(athlete_id, sport_modality, period_start)
+        await db.execute(
+            update(stats_table)
+            .where(bucket)
+            .values(workout_count=stats_table.c.workout_count - count, last_workout_at=latest)
+        )
+        await db.execute(delete(stats_table).where(bucket, stats_table.c.workout_count <= 0))
+
+
+def _week_start_expr(dialect_name: str, created_at):
+    if dialect_name == "postgresql":
+        return func.date_trunc("week", created_at).cast(stats_table.c.period_start.type)
+    # SQLite: avança até o domingo e volta 6 dias -> segunda-feira da semana
+    return func.date(created_at, literal_column("'weekday 0'"), literal_column("'-6 days'"))
+
+
+async def rebuild_stats(db: AsyncSession):
+    # treinos arquivados continuam contando nas estatísticas
+    history = union_all(
+        select(WorkoutModel.athlete_id, WorkoutModel.sport_modality, WorkoutModel.created_at),
+        select(
+            WorkoutArchiveModel.athlete_id,
+            WorkoutArchiveModel.sport_modality,
+            WorkoutArchiveModel.created_at,
+        ),
+    ).subquery("history")
+
+    period_start = _week_start_expr(db.bind.dialect.name, history.c.created_at).label("period_start")
+    source = (
+        select(
+            history.c.athlete_id,
+            history.c.sport_modality,
+            period_start,
+            func.count().label("workout_count"),
+            func.max(history.c.created_at).label("last_workout_at"),
+        )
+        .where(history.c.created_at.is_not(None))
+        .group_by(history.c.athlete_id, history.c.sport_modality, period_start)
+    )
+
+    await db.execute(delete(stats_table))
+    await db.execute(
+        insert(stats_table).from_select(
+            ["athlete_id", "sport_modality", "period_start", "workout_count", "last_workout_at"],
+            source,
+        )
+    )
+
+
+async def _main(argv: list[str]) -> int:
+    if argv != ["rebuild"]:
+        print("usage: python -m workout_api.contrib.stats rebuild")
+        return 2
+
+    async with database.session() as db:
+        await rebuild_stats(db)
+        await db.commit()
+    await database.dispose()
+    print("workout_stats rebuilt")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main(sys.argv[1:])))
@@ -0,0 +1,63 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+#
+# Aquecimento no startup: abre as conexões dos pools e executa uma vez as consultas
+# das rotas mais chamadas, para que a primeira requisição não pague a conexão
+# (PRAGMAs, WAL) nem a compilação do SQL.
+
+import asyncio
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from workout_api.configs.database import Database
+from workout_api.contrib.pagination import DEFAULT_LIMIT, keyset, select_fields
+from workout_api.models.athlete import AthleteModel
+from workout_api.models.workout import WorkoutModel
+from workout_api.schemas.athlete import AthleteOut
+from workout_api.schemas.workout import WorkoutOut
+
+logger = logging.getLogger("workout_api.warmup")
+
+
+def hot_statements() -> list:
+    # mesma forma de SQL das rotas: só os valores mudam, então o SQL compilado
+    # aqui é reaproveitado pelo cache de compilação da engine
+    athletes = select_fields(AthleteModel, AthleteOut)
+    workouts = select_fields(WorkoutModel, WorkoutOut)
+    return [
+        select(AthleteModel).where(AthleteModel.id == 0),
+        select(WorkoutModel).where(WorkoutModel.id == 0),
+        keyset(athletes, [AthleteModel.id], None).limit(DEFAULT_LIMIT + 1),
+        keyset(workouts, [WorkoutModel.id], None).limit(DEFAULT_LIMIT + 1),
+        keyset(
+            workouts.where(WorkoutModel.athlete_id == 0),
+            [WorkoutModel.created_at, WorkoutModel.id], None, descending=True,
+        ).limit(DEFAULT_LIMIT + 1),
+    ]
+
+
+def _pool_size(engine) -> int:
+    size = getattr(engine.sync_engine.pool, "size", None)
+    return size() if size else 1
+
+
+async def _run_hot_statements(database: Database):
+    async with database.read_session() as db:
+        for stmt in hot_statements():
+            await db.execute(stmt)
+
+
+async def warmup(database: Database):
+    database.connect()
+    try:
+        async with database.engine.connect():
+            pass
+        # uma sessão por conexão do pool de leitura: cada conexão nova é aberta,
+        # recebe os PRAGMAs e já prepara os statements
+        await asyncio.gather(
+            *(_run_hot_statements(database) for _ in range(_pool_size(database.read_engine)))
+        )
+    except SQLAlchemyError as exc:
+        # banco sem as migrações aplicadas ainda: a aplicação sobe e o erro aparece na rota
+        logger.warning("warmup skipped: %s", exc)
@@ -1,29 +1,90 @@
 # pylint: disable=missing-module-docstring
 
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import Optional
+
+from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeout
 
-from workout_api.routers import athlete, workout
+from workout_api.configs.database import Settings, database, get_settings
+from workout_api.contrib.admission import AdmissionMiddleware, admission, pool_exhausted
+from workout_api.contrib.archive import archive_periodically
+from workout_api.contrib.batching import workout_batcher
+from workout_api.contrib.cache import cache
+from workout_api.contrib.metrics import MetricsMiddleware, render_metrics
+from workout_api.contrib.warmup import warmup
+from workout_api.routers import athlete, stats, workout
 
 
-app = FastAPI(title="Workout API", version="1.0.0")
+health = APIRouter(tags=["Health"])
 
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-# Routers
-app.include_router(athlete.router)
-app.include_router(workout.router)
+@health.get("/")
+async def health_check():
+    return {"status": "ok", "message": "Workout API is running"}
 
 
+@health.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
 
 
-@app.get("/", tags=["Health"])
-async def health_check():
-    return {"status": "ok", "message": "Workout API is running"}
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # settings, engines e cache só são criados aqui, nunca no import do módulo
+    settings = app.state.settings or get_settings()
+    database.configure(settings)
+    cache.configure(settings)
+    admission.configure(settings)
+    workout_batcher.configure(settings.workout_batch_size, settings.workout_batch_max_delay_ms)
+    await warmup(database)
+
+    # arquivamento em segundo plano (desligado por padrão; pode rodar pelo CLI)
+    archiver = None
+    if settings.archive_interval_seconds:
+        archiver = asyncio.create_task(archive_periodically(settings))
+
+    yield
+
+    if archiver is not None:
+        archiver.cancel()
+        with suppress(asyncio.CancelledError):
+            await archiver
+    await workout_batcher.close()
+    await database.dispose()
+
+
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    app = FastAPI(title="Workout API", version="1.0.0", lifespan=lifespan)
+    app.state.settings = settings
+
+    # Controle de admissão (fica por dentro do CORS para o 503 sair com os headers)
+    app.add_middleware(AdmissionMiddleware)
+    app.add_exception_handler(PoolTimeout, pool_exhausted)
+
+    # CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Métricas (latência por rota e queries por requisição)
+    app.add_middleware(MetricsMiddleware)
+
+    # Routers
+    app.include_router(health)
+    app.include_router(athlete.router)
+    app.include_router(workout.router)
+    app.include_router(stats.router)
+
+    return app
+
+
+# `uvicorn workout_api.main:app`; montar o app não lê settings nem abre conexões
+app = create_app()
@@ -2,7 +2,11 @@
 
 from workout_api.models.athlete import AthleteModel
 from workout_api.models.workout import WorkoutModel
+from workout_api.models.stats import WorkoutStatsModel
+from workout_api.models.archive import WorkoutArchiveModel, WorkoutRollupModel
 
 
-__all__ = ["AthleteModel", "WorkoutModel"]
+__all__ = [
+    "AthleteModel", "WorkoutModel", "WorkoutStatsModel", "WorkoutArchiveModel", "WorkoutRollupModel"
+]
 
@@ -0,0 +1,32 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring
+
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Index
+from datetime import datetime
+from workout_api.configs.database import Base
+
+class WorkoutArchiveModel(Base):
+    # treinos antigos saídos da tabela workout, com os mesmos ids; só leitura e só
+    # os índices usados pelas leituras do arquivo (sem o de modalidade)
+    __tablename__ = "workout_archive"
+    __table_args__ = (
+        Index("ix_workout_archive_athlete_id_created_at", "athlete_id", "created_at"),
+        Index("ix_workout_archive_created_at", "created_at"),
+        # as linhas nunca são atualizadas: páginas cheias no PostgreSQL
+        {"postgresql_with": {"fillfactor": 100}},
+    )
+
+    id: int = Column(Integer, primary_key=True, autoincrement=False)
+    athlete_id: int = Column(Integer, ForeignKey("athlete.id"), nullable=False)
+    name: str = Column(String(50), nullable=False)
+    sport_modality: str = Column(String(50), nullable=False)
+    created_at: datetime = Column(DateTime, nullable=False)
+
+class WorkoutRollupModel(Base):
+    # totais por atleta/modalidade do que já foi arquivado, gravados pelo arquivamento
+    __tablename__ = "workout_archive_rollup"
+
+    athlete_id: int = Column(Integer, ForeignKey("athlete.id"), primary_key=True)
+    sport_modality: str = Column(String(50), primary_key=True)
+    workout_count: int = Column(Integer, nullable=False, default=0)
+    first_workout_at: datetime = Column(DateTime, nullable=False)
+    last_workout_at: datetime = Column(DateTime, nullable=False)
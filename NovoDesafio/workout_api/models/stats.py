@@ -0,0 +1,14 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring
+
+from sqlalchemy import Column, String, Integer, ForeignKey, Date, DateTime
+from datetime import date, datetime
+from workout_api.configs.database import Base
+
+class WorkoutStatsModel(Base):
+    __tablename__ = "workout_stats"
+
+    athlete_id: int = Column(Integer, ForeignKey("athlete.id"), primary_key=True)
+    sport_modality: str = Column(String(50), primary_key=True)
+    period_start: date = Column(Date, primary_key=True)
+    workout_count: int = Column(Integer, nullable=False, default=0)
+    last_workout_at: datetime = Column(DateTime, nullable=True)
@@ -1,12 +1,18 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring
 
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from workout_api.configs.database import Base
 
 class WorkoutModel(Base):
     __tablename__ = "workout"
+    __table_args__ = (
+        Index("ix_workout_athlete_id_created_at", "athlete_id", "created_at"),
+        Index("ix_workout_sport_modality_created_at", "sport_modality", "created_at"),
+        # ids nunca são reaproveitados, nem depois de arquivar os treinos mais novos
+        {"sqlite_autoincrement": True},
+    )
 
     id: int = Column(Integer, primary_key=True)
     athlete_id: int = Column(Integer, ForeignKey("athlete.id"), nullable=False)
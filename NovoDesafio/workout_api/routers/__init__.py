@@ -1,5 +1,5 @@
 # pylint: disable=missing-module-docstring
 
-from workout_api.routers import athlete, workout
+from workout_api.routers import athlete, stats, workout
 
-__all__ = ["athlete", "workout"]
+__all__ = ["athlete", "stats", "workout"]
@@ -1,34 +1,132 @@
 # pylint: disable=missing-module-docstring, missing-function-docstring, import-error
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from typing import Literal, Optional, Union
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, exists, insert, or_, select, update
 
-from workout_api.configs.database import get_session
+from workout_api.configs.database import database, get_read_session, get_session
+from workout_api.contrib.admission import single_flight
+from workout_api.contrib.archive import archived_until
+from workout_api.contrib.cache import cache, cached_response, encode_entry, athlete_key
+from workout_api.contrib.dates import CreatedRange, created_range
+from workout_api.contrib.export import ExportFormat, export_response
+from workout_api.contrib.includes import (
+    DEFAULT_INCLUDED_WORKOUTS, MAX_INCLUDED_WORKOUTS, attach_workouts
+)
+from workout_api.contrib.search import search_statement, search_terms
+from workout_api.contrib.pagination import (
+    DEFAULT_LIMIT, MAX_LIMIT, CursorPage, merge_pages, page_response, paginate, select_fields
+)
+from workout_api.models.archive import WorkoutArchiveModel
 from workout_api.models.athlete import AthleteModel
-from workout_api.schemas.athlete import AthleteIn, AthleteOut, AthleteUpdate
+from workout_api.models.stats import WorkoutStatsModel
+from workout_api.models.workout import WorkoutModel
+from workout_api.schemas.athlete import AthleteIn, AthleteOut, AthleteSearchOut, AthleteUpdate
+from workout_api.schemas.bulk import BULK_MAX_ITEMS, BulkItemResult
+from workout_api.schemas.compound import AthleteWithWorkoutsOut
+from workout_api.schemas.stats import WorkoutStatsOut
+from workout_api.schemas.workout import WorkoutOut
 
 router = APIRouter(prefix="/athletes", tags=["Athletes"])
 
 
 @router.post("/", response_model=AthleteOut, status_code=status.HTTP_201_CREATED)
 async def create_athlete(data: AthleteIn, db: AsyncSession = Depends(get_session)):
-    athlete = AthleteModel(**data.model_dump())
-    db.add(athlete)
+    result = await db.execute(
+        insert(AthleteModel).values(**data.model_dump()).returning(AthleteModel)
+    )
+    athlete = result.scalar_one()
     await db.commit()
-    await db.refresh(athlete)
+    await cache.set(athlete_key(athlete.id), encode_entry(AthleteOut.model_validate(athlete)))
     return athlete
 
 
-@router.get("/", response_model=list[AthleteOut])
-async def list_athletes(db: AsyncSession = Depends(get_session)):
-    result = await db.execute(select(AthleteModel))
-    return result.scalars().all()
+@router.post("/bulk", response_model=list[BulkItemResult])
+async def create_athletes_bulk(
+    items: list[AthleteIn] = Body(..., max_length=BULK_MAX_ITEMS),
+    db: AsyncSession = Depends(get_session)
+):
+    cpfs = {item.cpf for item in items}
+    result = await db.execute(select(AthleteModel.cpf).where(AthleteModel.cpf.in_(cpfs)))
+    seen = set(result.scalars().all())
+
+    results = []
+    rows = []
+    for index, item in enumerate(items):
+        if item.cpf in seen:
+            results.append(BulkItemResult(index=index, status="duplicate_cpf"))
+            continue
+        seen.add(item.cpf)
+        results.append(BulkItemResult(index=index, status="created"))
+        rows.append(item.model_dump())
+
+    if rows:
+        try:
+            result = await db.execute(
+                insert(AthleteModel).returning(AthleteModel.id, sort_by_parameter_order=True),
+                rows,
+            )
+            await db.commit()
+        except IntegrityError as exc:
+            # outra requisição cadastrou um dos CPFs entre a checagem e o INSERT
+            await db.rollback()
+            raise HTTPException(status_code=409, detail="Duplicate CPF") from exc
+
+        ids = iter(result.scalars().all())
+        for item_result in results:
+            if item_result.status == "created":
+                item_result.id = next(ids)
+
+    return results
+
+
+@router.get("/", response_model=CursorPage[Union[AthleteWithWorkoutsOut, AthleteOut]])
+async def list_athletes(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    include: Optional[Literal["workouts"]] = None,
+    workouts_limit: int = Query(DEFAULT_INCLUDED_WORKOUTS, ge=1, le=MAX_INCLUDED_WORKOUTS),
+    db: AsyncSession = Depends(get_read_session)
+):
+    page = await paginate(
+        db, select_fields(AthleteModel, AthleteOut), [AthleteModel.id], cursor, limit
+    )
+    if include == "workouts":
+        await attach_workouts(db, page["items"], workouts_limit)
+    return page_response(page)
+
+
+@router.get("/export")
+async def export_athletes(fmt: ExportFormat = Query("ndjson", alias="format")):
+    stmt = select(
+        AthleteModel.id, AthleteModel.name, AthleteModel.cpf, AthleteModel.age
+    ).order_by(AthleteModel.id)
+    return export_response(stmt, fmt, "athletes")
+
 
+@router.get("/search", response_model=CursorPage[AthleteSearchOut])
+async def search_athletes(
+    q: str = Query(..., min_length=2, max_length=50),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    db: AsyncSession = Depends(get_read_session)
+):
+    terms = search_terms(q)
+    if not terms:
+        return page_response({"items": [], "next_cursor": None})
+
+    stmt, columns = search_statement(db, terms)
+    page = await paginate(db, stmt, columns, cursor, limit)
+    return page_response(page)
 
-@router.get("/{athlete_id}", response_model=AthleteOut)
-async def get_athlete(athlete_id: int, db: AsyncSession = Depends(get_session)):
-    result = await db.execute(select(AthleteModel).where(AthleteModel.id == athlete_id))
+
+@router.get("/by-cpf/{cpf}", response_model=AthleteOut)
+async def get_athlete_by_cpf(cpf: str, db: AsyncSession = Depends(get_read_session)):
+    result = await db.execute(select(AthleteModel).where(AthleteModel.cpf == cpf))
     athlete = result.scalar_one_or_none()
 
     if not athlete:
@@ -37,33 +135,179 @@ async def get_athlete(athlete_id: int, db: AsyncSession = Depends(get_session)):
     return athlete
 
 
+@router.get("/{athlete_id}", response_model=Union[AthleteWithWorkoutsOut, AthleteOut])
+async def get_athlete(
+    athlete_id: int,
+    request: Request,
+    include: Optional[Literal["workouts"]] = None,
+    workouts_limit: int = Query(DEFAULT_INCLUDED_WORKOUTS, ge=1, le=MAX_INCLUDED_WORKOUTS),
+    db: AsyncSession = Depends(get_read_session)
+):
+    if include == "workouts":
+        # o documento composto não passa pelo cache: os treinos mudam sem invalidar o atleta
+        result = await db.execute(
+            select_fields(AthleteModel, AthleteOut).where(AthleteModel.id == athlete_id)
+        )
+        athlete = result.mappings().one_or_none()
+
+        if not athlete:
+            raise HTTPException(status_code=404, detail="Athlete not found")
+
+        athletes = await attach_workouts(db, [dict(athlete)], workouts_limit)
+        return page_response(athletes[0])
+
+    key = athlete_key(athlete_id)
+    entry = await cache.get(key)
+
+    if entry is None:
+        # a versão entra na chave do single-flight: depois de uma escrita ninguém
+        # aproveita uma consulta que começou antes dela
+        version = await cache.version(key)
+        entry = await single_flight.do(
+            f"{key}@{version[0]}", "athlete", lambda: _load_athlete(athlete_id, version)
+        )
+
+    return cached_response(entry, request)
+
+
+async def _load_athlete(athlete_id: int, version: tuple[int, float]) -> bytes:
+    # sessão própria: a consulta é compartilhada por todas as requisições simultâneas
+    # pelo mesmo atleta e pode sobreviver à requisição que a iniciou
+    async with database.read_session() as db:
+        result = await db.execute(select(AthleteModel).where(AthleteModel.id == athlete_id))
+        athlete = result.scalar_one_or_none()
+
+    if not athlete:
+        raise HTTPException(status_code=404, detail="Athlete not found")
+
+    entry = encode_entry(AthleteOut.model_validate(athlete))
+    await cache.fill(athlete_key(athlete_id), entry, version)
+    return entry
+
+
+@router.get("/{athlete_id}/workouts", response_model=CursorPage[WorkoutOut])
+async def list_athlete_workouts(
+    athlete_id: int,
+    sport_modality: Optional[str] = None,
+    created: CreatedRange = Depends(created_range),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    db: AsyncSession = Depends(get_read_session)
+):
+    # usa o índice (athlete_id, created_at), do mais recente para o mais antigo
+    def workouts(model):
+        stmt = select_fields(model, WorkoutOut).where(model.athlete_id == athlete_id)
+        if sport_modality is not None:
+            stmt = stmt.where(model.sport_modality == sport_modality)
+        return created.where(stmt, model)
+
+    columns = [WorkoutModel.created_at, WorkoutModel.id]
+    page = await paginate(db, workouts(WorkoutModel), columns, cursor, limit, descending=True)
+
+    # o arquivo só entra quando a página chega na época dele: o treino arquivado mais
+    # recente do atleta vem das rollups, sem tocar em workout_archive
+    latest_archived = await archived_until(db, athlete_id, sport_modality)
+    if (
+        latest_archived is not None
+        and created.reaches(latest_archived)
+        and (page["next_cursor"] is None or page["items"][-1]["created_at"] <= latest_archived)
+    ):
+        archived_page = await paginate(
+            db,
+            workouts(WorkoutArchiveModel),
+            [WorkoutArchiveModel.created_at, WorkoutArchiveModel.id],
+            cursor,
+            limit,
+            descending=True,
+        )
+        page = merge_pages([page, archived_page], columns, limit, descending=True)
+
+    if not page["items"] and not cursor:
+        result = await db.execute(select(AthleteModel.id).where(AthleteModel.id == athlete_id))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail="Athlete not found")
+
+    return page_response(page)
+
+
+@router.get("/{athlete_id}/stats", response_model=list[WorkoutStatsOut])
+async def get_athlete_stats(
+    athlete_id: int,
+    sport_modality: Optional[str] = None,
+    period_from: Optional[date] = None,
+    period_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_read_session)
+):
+    # lê apenas os buckets pré-calculados (workout_stats), nunca a tabela workout
+    stmt = select(WorkoutStatsModel).where(WorkoutStatsModel.athlete_id == athlete_id)
+
+    if sport_modality is not None:
+        stmt = stmt.where(WorkoutStatsModel.sport_modality == sport_modality)
+    if period_from is not None:
+        stmt = stmt.where(WorkoutStatsModel.period_start >= period_from)
+    if period_to is not None:
+        stmt = stmt.where(WorkoutStatsModel.period_start < period_to)
+
+    result = await db.execute(
+        stmt.order_by(WorkoutStatsModel.period_start.desc(), WorkoutStatsModel.sport_modality)
+    )
+    stats = result.scalars().all()
+
+    if not stats:
+        result = await db.execute(select(AthleteModel.id).where(AthleteModel.id == athlete_id))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail="Athlete not found")
+
+    return stats
+
+
 @router.patch("/{athlete_id}", response_model=AthleteOut)
 async def update_athlete(
     athlete_id: int,
     updates: AthleteUpdate,
     db: AsyncSession = Depends(get_session)
 ):
-    result = await db.execute(select(AthleteModel).where(AthleteModel.id == athlete_id))
+    values = updates.model_dump(exclude_unset=True)
+    if values:
+        stmt = (
+            update(AthleteModel)
+            .where(AthleteModel.id == athlete_id)
+            .values(**values)
+            .returning(AthleteModel)
+        )
+    else:
+        stmt = select(AthleteModel).where(AthleteModel.id == athlete_id)
+
+    result = await db.execute(stmt)
     athlete = result.scalar_one_or_none()
 
     if not athlete:
         raise HTTPException(status_code=404, detail="Athlete not found")
 
-    for key, value in updates.model_dump(exclude_unset=True).items():
-        setattr(athlete, key, value)
-
     await db.commit()
-    await db.refresh(athlete)
+    await cache.invalidate(athlete_key(athlete.id))
     return athlete
 
 
 @router.delete("/{athlete_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_athlete(athlete_id: int, db: AsyncSession = Depends(get_session)):
-    result = await db.execute(select(AthleteModel).where(AthleteModel.id == athlete_id))
-    athlete = result.scalar_one_or_none()
+    # o SQLite não aplica as foreign keys: um atleta com treinos (quentes ou
+    # arquivados) não é apagado, senão os treinos e as estatísticas ficam órfãos
+    has_workouts = or_(
+        exists().where(WorkoutModel.athlete_id == athlete_id),
+        exists().where(WorkoutArchiveModel.athlete_id == athlete_id),
+    )
+    result = await db.execute(
+        delete(AthleteModel)
+        .where(AthleteModel.id == athlete_id, ~has_workouts)
+        .returning(AthleteModel.id)
+    )
 
-    if not athlete:
+    if result.scalar_one_or_none() is None:
+        result = await db.execute(select(AthleteModel.id).where(AthleteModel.id == athlete_id))
+        if result.scalar_one_or_none() is not None:
+            raise HTTPException(status_code=409, detail="Athlete has workouts")
         raise HTTPException(status_code=404, detail="Athlete not found")
 
-    await db.delete(athlete)
     await db.commit()
+    await cache.invalidate(athlete_key(athlete_id))
@@ -0,0 +1,36 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring, import-error
+
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+
+from workout_api.configs.database import get_read_session
+from workout_api.models.stats import WorkoutStatsModel
+from workout_api.schemas.stats import ModalityStatsOut
+
+router = APIRouter(prefix="/stats", tags=["Stats"])
+
+
+@router.get("/modalities", response_model=list[ModalityStatsOut])
+async def get_modality_stats(
+    period_from: Optional[date] = None,
+    period_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_read_session)
+):
+    stmt = select(
+        WorkoutStatsModel.sport_modality,
+        func.sum(WorkoutStatsModel.workout_count).label("workout_count"),
+        func.count(func.distinct(WorkoutStatsModel.athlete_id)).label("athlete_count"),
+        func.max(WorkoutStatsModel.last_workout_at).label("last_workout_at"),
+    ).group_by(WorkoutStatsModel.sport_modality)
+
+    if period_from is not None:
+        stmt = stmt.where(WorkoutStatsModel.period_start >= period_from)
+    if period_to is not None:
+        stmt = stmt.where(WorkoutStatsModel.period_start < period_to)
+
+    result = await db.execute(stmt.order_by(WorkoutStatsModel.sport_modality))
+    return result.all()
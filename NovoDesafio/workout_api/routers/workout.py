@@ -1,12 +1,29 @@
 # pylint: disable=missing-module-docstring, missing-function-docstring, import-error
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Literal, Optional, Union
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, insert, literal, select, union_all, update
 
-from workout_api.configs.database import get_session
+from workout_api.configs.database import database, get_read_session, get_session
+from workout_api.contrib.admission import single_flight
+from workout_api.contrib.archive import ARCHIVE_COLUMNS, ArchiveHorizon, archive_horizon
+from workout_api.contrib.batching import insert_workouts, workout_batcher
+from workout_api.contrib.cache import cache, cached_response, encode_entry, workout_key
+from workout_api.contrib.dates import CreatedRange, created_range
+from workout_api.contrib.export import ExportFormat, export_response
+from workout_api.contrib.includes import attach_athletes
+from workout_api.contrib.pagination import (
+    DEFAULT_LIMIT, MAX_LIMIT, CursorPage, decode_cursor, merge_pages, page_response, paginate,
+    select_fields,
+)
+from workout_api.contrib.stats import record_workouts, remove_workouts
 from workout_api.models.workout import WorkoutModel
+from workout_api.models.archive import WorkoutArchiveModel
 from workout_api.models.athlete import AthleteModel
+from workout_api.schemas.bulk import BULK_MAX_ITEMS, BulkItemResult
+from workout_api.schemas.compound import WorkoutWithAthleteOut
 from workout_api.schemas.workout import WorkoutIn, WorkoutOut, WorkoutUpdate
 
 router = APIRouter(prefix="/workouts", tags=["Workouts"])
@@ -14,36 +31,185 @@ router = APIRouter(prefix="/workouts", tags=["Workouts"])
 
 @router.post("/", response_model=WorkoutOut, status_code=status.HTTP_201_CREATED)
 async def create_workout(data: WorkoutIn, db: AsyncSession = Depends(get_session)):
+    if database.settings.workout_batch_enabled:
+        workout = await workout_batcher.submit(data)
+        await cache.set(workout_key(workout.id), encode_entry(workout))
+        return workout
+
+    # INSERT ... SELECT: se o atleta não existir nenhuma linha é inserida
+    source = select(
+        AthleteModel.id,
+        literal(data.name, WorkoutModel.name.type),
+        literal(data.sport_modality, WorkoutModel.sport_modality.type),
+    ).where(AthleteModel.id == data.athlete_id)
 
-    # verificar se o atleta existe
-    result = await db.execute(select(AthleteModel).where(AthleteModel.id == data.athlete_id))
-    athlete = result.scalar_one_or_none()
+    result = await db.execute(
+        insert(WorkoutModel)
+        .from_select(["athlete_id", "name", "sport_modality"], source)
+        .returning(WorkoutModel)
+    )
+    workout = result.scalar_one_or_none()
 
-    if not athlete:
+    if not workout:
         raise HTTPException(status_code=404, detail="Athlete not found")
 
-    workout = WorkoutModel(**data.model_dump())
-    db.add(workout)
+    await record_workouts(db, [(workout.athlete_id, workout.sport_modality, workout.created_at)])
     await db.commit()
-    await db.refresh(workout)
+    await cache.set(workout_key(workout.id), encode_entry(WorkoutOut.model_validate(workout)))
     return workout
 
 
-@router.get("/", response_model=list[WorkoutOut])
-async def list_workouts(db: AsyncSession = Depends(get_session)):
-    result = await db.execute(select(WorkoutModel))
-    return result.scalars().all()
+@router.post("/bulk", response_model=list[BulkItemResult])
+async def create_workouts_bulk(
+    items: list[WorkoutIn] = Body(..., max_length=BULK_MAX_ITEMS),
+    db: AsyncSession = Depends(get_session)
+):
+    outputs = await insert_workouts(db, items)
+    await db.commit()
 
+    return [
+        BulkItemResult(index=index, status="created", id=output.id)
+        if output else BulkItemResult(index=index, status="unknown_athlete")
+        for index, output in enumerate(outputs)
+    ]
+
+
+def _needs_archive(
+    horizon: Optional[ArchiveHorizon], order_by: str, cursor: Optional[str], created: CreatedRange
+) -> bool:
+    # ordem crescente: o arquivo só tem algo a partir do cursor se o cursor ainda
+    # estiver antes da linha mais nova arquivada (max id / max created_at)
+    if horizon is None:
+        return False
+    if not created.reaches(horizon.max_created_at):
+        return False
+    if cursor is None:
+        return True
+    if order_by == "id":
+        (after_id,) = decode_cursor(cursor, [WorkoutModel.id])
+        return after_id < horizon.max_id
+    after_created_at, _ = decode_cursor(cursor, [WorkoutModel.created_at, WorkoutModel.id])
+    return after_created_at <= horizon.max_created_at
+
+
+@router.get("/", response_model=CursorPage[Union[WorkoutWithAthleteOut, WorkoutOut]])
+async def list_workouts(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    order_by: Literal["id", "created_at"] = "id",
+    created: CreatedRange = Depends(created_range),
+    include: Optional[Literal["athlete"]] = None,
+    db: AsyncSession = Depends(get_read_session)
+):
+    columns = [WorkoutModel.id]
+    if order_by == "created_at":
+        columns = [WorkoutModel.created_at, WorkoutModel.id]
+
+    stmt = created.where(select_fields(WorkoutModel, WorkoutOut), WorkoutModel)
+    page = await paginate(db, stmt, columns, cursor, limit)
+
+    if _needs_archive(await archive_horizon(db), order_by, cursor, created):
+        archived = created.where(select_fields(WorkoutArchiveModel, WorkoutOut), WorkoutArchiveModel)
+        archived_columns = [getattr(WorkoutArchiveModel, column.key) for column in columns]
+        archived_page = await paginate(db, archived, archived_columns, cursor, limit)
+        page = merge_pages([page, archived_page], columns, limit)
+
+    if include == "athlete":
+        await attach_athletes(db, page["items"])
+    return page_response(page)
+
+
+@router.get("/export")
+async def export_workouts(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    athlete_id: Optional[int] = None,
+    created: CreatedRange = Depends(created_range),
+    db: AsyncSession = Depends(get_read_session)
+):
+    models = [WorkoutModel]
+    horizon = await archive_horizon(db)
+    if horizon is not None and created.reaches(horizon.max_created_at):
+        models.append(WorkoutArchiveModel)
+
+    selects = []
+    for model in models:
+        stmt = select(*(getattr(model, name) for name in ARCHIVE_COLUMNS))
+        if athlete_id is not None:
+            stmt = stmt.where(model.athlete_id == athlete_id)
+        selects.append(created.where(stmt, model))
+
+    if len(selects) == 1:
+        stmt = selects[0].order_by(WorkoutModel.id)
+    else:
+        # cada lado sai ordenado por id e o banco só intercala os dois (MERGE no SQLite)
+        stmt = union_all(*selects).order_by("id")
+
+    return export_response(stmt, fmt, "workouts")
 
-@router.get("/{workout_id}", response_model=WorkoutOut)
-async def get_workout(workout_id: int, db: AsyncSession = Depends(get_session)):
-    result = await db.execute(select(WorkoutModel).where(WorkoutModel.id == workout_id))
-    workout = result.scalar_one_or_none()
+
+@router.get("/{workout_id}", response_model=Union[WorkoutWithAthleteOut, WorkoutOut])
+async def get_workout(
+    workout_id: int,
+    request: Request,
+    include: Optional[Literal["athlete"]] = None,
+    db: AsyncSession = Depends(get_read_session)
+):
+    if include == "athlete":
+        workout = None
+        for model in (WorkoutModel, WorkoutArchiveModel):
+            result = await db.execute(select_fields(model, WorkoutOut).where(model.id == workout_id))
+            workout = result.mappings().one_or_none()
+            if workout:
+                break
+
+        if not workout:
+            raise HTTPException(status_code=404, detail="Workout not found")
+
+        workouts = await attach_athletes(db, [dict(workout)])
+        return page_response(workouts[0])
+
+    key = workout_key(workout_id)
+    entry = await cache.get(key)
+
+    if entry is None:
+        # a versão entra na chave do single-flight: depois de uma escrita ninguém
+        # aproveita uma consulta que começou antes dela
+        version = await cache.version(key)
+        entry = await single_flight.do(
+            f"{key}@{version[0]}", "workout", lambda: _load_workout(workout_id, version)
+        )
+
+    return cached_response(entry, request)
+
+
+async def _load_workout(workout_id: int, version: tuple[int, float]) -> bytes:
+    # sessão própria: a consulta é compartilhada pelas requisições simultâneas
+    async with database.read_session() as db:
+        result = await db.execute(select(WorkoutModel).where(WorkoutModel.id == workout_id))
+        workout = result.scalar_one_or_none()
+
+        if not workout:
+            # treinos antigos: mesmo id, agora na tabela de arquivo
+            result = await db.execute(
+                select(WorkoutArchiveModel).where(WorkoutArchiveModel.id == workout_id)
+            )
+            workout = result.scalar_one_or_none()
 
     if not workout:
         raise HTTPException(status_code=404, detail="Workout not found")
 
-    return workout
+    entry = encode_entry(WorkoutOut.model_validate(workout))
+    await cache.fill(workout_key(workout_id), entry, version)
+    return entry
+
+
+async def _missing_workout(db: AsyncSession, workout_id: int) -> HTTPException:
+    result = await db.execute(
+        select(WorkoutArchiveModel.id).where(WorkoutArchiveModel.id == workout_id)
+    )
+    if result.scalar_one_or_none() is not None:
+        return HTTPException(status_code=409, detail="Archived workouts are read-only")
+    return HTTPException(status_code=404, detail="Workout not found")
 
 
 @router.patch("/{workout_id}", response_model=WorkoutOut)
@@ -52,27 +218,55 @@ async def update_workout(
     updates: WorkoutUpdate,
     db: AsyncSession = Depends(get_session)
 ):
-    result = await db.execute(select(WorkoutModel).where(WorkoutModel.id == workout_id))
+    values = updates.model_dump(exclude_unset=True)
+
+    # trocar a modalidade move o treino de bucket nas estatísticas
+    previous = None
+    if "sport_modality" in values:
+        result = await db.execute(
+            select(WorkoutModel.athlete_id, WorkoutModel.sport_modality, WorkoutModel.created_at)
+            .where(WorkoutModel.id == workout_id)
+            .with_for_update()
+        )
+        previous = result.one_or_none()
+
+    if values:
+        stmt = (
+            update(WorkoutModel)
+            .where(WorkoutModel.id == workout_id)
+            .values(**values)
+            .returning(WorkoutModel)
+        )
+    else:
+        stmt = select(WorkoutModel).where(WorkoutModel.id == workout_id)
+
+    result = await db.execute(stmt)
     workout = result.scalar_one_or_none()
 
     if not workout:
-        raise HTTPException(status_code=404, detail="Workout not found")
+        raise await _missing_workout(db, workout_id)
 
-    for key, value in updates.model_dump(exclude_unset=True).items():
-        setattr(workout, key, value)
+    if previous and previous.sport_modality != workout.sport_modality:
+        await remove_workouts(db, [tuple(previous)])
+        await record_workouts(db, [(workout.athlete_id, workout.sport_modality, workout.created_at)])
 
     await db.commit()
-    await db.refresh(workout)
+    await cache.invalidate(workout_key(workout.id))
     return workout
 
 
 @router.delete("/{workout_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_workout(workout_id: int, db: AsyncSession = Depends(get_session)):
-    result = await db.execute(select(WorkoutModel).where(WorkoutModel.id == workout_id))
-    workout = result.scalar_one_or_none()
+    result = await db.execute(
+        delete(WorkoutModel)
+        .where(WorkoutModel.id == workout_id)
+        .returning(WorkoutModel.athlete_id, WorkoutModel.sport_modality, WorkoutModel.created_at)
+    )
+    deleted = result.one_or_none()
 
-    if not workout:
-        raise HTTPException(status_code=404, detail="Workout not found")
+    if deleted is None:
+        raise await _missing_workout(db, workout_id)
 
-    await db.delete(workout)
+    await remove_workouts(db, [tuple(deleted)])
     await db.commit()
+    await cache.invalidate(workout_key(workout_id))
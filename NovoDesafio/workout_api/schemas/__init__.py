@@ -1,9 +1,14 @@
 # pylint: disable=missing-module-docstring, import-error
 
-from workout_api.schemas.athlete import AthleteIn, AthleteOut, AthleteUpdate
+from workout_api.schemas.athlete import AthleteIn, AthleteOut, AthleteSearchOut, AthleteUpdate
+from workout_api.schemas.bulk import BulkItemResult
+from workout_api.schemas.compound import AthleteWithWorkoutsOut, WorkoutWithAthleteOut
+from workout_api.schemas.stats import ModalityStatsOut, WorkoutStatsOut
 from workout_api.schemas.workout import WorkoutIn, WorkoutOut, WorkoutUpdate
 
 __all__ = [
-    "AthleteIn", "AthleteOut", "AthleteUpdate",
-    "WorkoutIn", "WorkoutOut", "WorkoutUpdate"
+    "AthleteIn", "AthleteOut", "AthleteSearchOut", "AthleteUpdate",
+    "WorkoutIn", "WorkoutOut", "WorkoutUpdate",
+    "AthleteWithWorkoutsOut", "WorkoutWithAthleteOut",
+    "BulkItemResult", "WorkoutStatsOut", "ModalityStatsOut"
 ]
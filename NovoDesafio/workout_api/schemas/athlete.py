@@ -17,6 +17,9 @@ class AthleteOut(BaseModel):
     class Config:
         from_attributes = True
 
+class AthleteSearchOut(AthleteOut):
+    rank: float
+
 class AthleteUpdate(BaseModel):
     name: Optional[str] = Field(None, max_length=50)
     age: Optional[int] = Field(None, gt=0)
@@ -0,0 +1,11 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring
+
+from pydantic import BaseModel
+from typing import Literal, Optional
+
+BULK_MAX_ITEMS = 1000
+
+class BulkItemResult(BaseModel):
+    index: int
+    status: Literal["created", "duplicate_cpf", "unknown_athlete"]
+    id: Optional[int] = None
@@ -0,0 +1,10 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring
+
+from workout_api.schemas.athlete import AthleteOut
+from workout_api.schemas.workout import WorkoutOut
+
+class AthleteWithWorkoutsOut(AthleteOut):
+    workouts: list[WorkoutOut]
+
+class WorkoutWithAthleteOut(WorkoutOut):
+    athlete: AthleteOut
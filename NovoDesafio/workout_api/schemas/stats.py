@@ -0,0 +1,23 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring
+
+from pydantic import BaseModel
+from datetime import date, datetime
+from typing import Optional
+
+class WorkoutStatsOut(BaseModel):
+    sport_modality: str
+    period_start: date
+    workout_count: int
+    last_workout_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+class ModalityStatsOut(BaseModel):
+    sport_modality: str
+    workout_count: int
+    athlete_count: int
+    last_workout_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True